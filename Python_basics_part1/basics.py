@@ -1,33 +1,34 @@
-print("Hello World")
+if __name__ == "__main__":
+    print("Hello World")
 
-a = 5
-b = 10
+    a = 5
+    b = 10
 
-c = "Python"
-print("Language:", c)
+    c = "Python"
+    print("Language:", c)
 
-list_example = [1, 2, 3, 4, 5]
+    list_example = [1, 2, 3, 4, 5]
 
-sum = a + b
-print("Sum:", sum)
-diff = b - a
-print("Difference:", diff)
-prod = a * b
-print("Product:", prod)
-quot = b / a
-print("Quotient:", quot)
+    sum = a + b
+    print("Sum:", sum)
+    diff = b - a
+    print("Difference:", diff)
+    prod = a * b
+    print("Product:", prod)
+    quot = b / a
+    print("Quotient:", quot)
 
-str_example = "This is a string example."
-print(str_example)
-print(sorted(list_example))
+    str_example = "This is a string example."
+    print(str_example)
+    print(sorted(list_example))
 
-if a < b:
-    print(f"{a} is less than {b}") 
-else:
-    print(f"{a} is not less than {b}")
+    if a < b:
+        print(f"{a} is less than {b}") 
+    else:
+        print(f"{a} is not less than {b}")
 
-for i in list_example:
-    print("List item:", i)
+    for i in list_example:
+        print("List item:", i)
 
 
 #Two Sum
@@ -45,14 +46,17 @@ def two_sum(nums, target):
     
     return []
 
-arr = [2, 7, 11, 15]
-target = 9
-result = two_sum(arr, target)
-print("Two Sum Result:", result)
+if __name__ == "__main__":
+    arr = [2, 7, 11, 15]
+    target = 9
+    result = two_sum(arr, target)
+    print("Two Sum Result:", result)
 
 
 #two numbers add
 class ListNode:
+    __slots__ = ('val', 'next')  # no per-node __dict__, much less memory per digit
+
     def __init__(self, val=0, next=None):
         self.val = val
         self.next = next
@@ -106,10 +110,11 @@ def linked_list_to_list(head):
     return result
 
 
-l1 = create_linked_list([2, 4, 3])
-l2 = create_linked_list([5, 6, 4])
-result = addTwoNumbers(l1, l2)
-print(linked_list_to_list(result))  # Output: [7, 0, 8]
+if __name__ == "__main__":
+    l1 = create_linked_list([2, 4, 3])
+    l2 = create_linked_list([5, 6, 4])
+    result = addTwoNumbers(l1, l2)
+    print(linked_list_to_list(result))  # Output: [7, 0, 8]
 
 
 
@@ -154,4 +159,5 @@ def test_longest_substring():
         print(result2)
 
 # Run tests
-test_longest_substring()
\ No newline at end of file
+if __name__ == "__main__":
+    test_longest_substring()
\ No newline at end of file
@@ -0,0 +1,260 @@
+#Big numbers as base 10^9 limbs instead of one ListNode per digit
+"""
+addTwoNumbers() in basics.py works on linked lists with one node per
+decimal digit (least significant first). LimbNumber keeps the same number
+as an array of base 10^9 "limbs", also least significant first:
+
+    digits 2 -> 4 -> 3 (= 342)        limbs [342]
+    1234567890123                    limbs [567890123, 1234]
+
+One 4-byte limb holds 9 digits, so a million-digit number is ~111k limbs
+(~0.4 MB) instead of a million node objects. Addition works limb by limb
+(NumPy vectorized when available), never per digit.
+"""
+
+from array import array
+
+from basics import ListNode
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BASE = 10 ** 9
+LIMB_DIGITS = 9
+_POWERS = np.array([10 ** i for i in range(LIMB_DIGITS)], dtype=np.uint64) if np is not None else None
+
+
+class LimbNumber:
+    __slots__ = ('limbs',)
+
+    def __init__(self, limbs=None):
+        self.limbs = array('I', limbs or [0])
+        self._trim()
+
+    def _trim(self):
+        while len(self.limbs) > 1 and self.limbs[-1] == 0:
+            self.limbs.pop()
+
+    # ---------- converters ----------
+
+    @classmethod
+    def from_str(cls, text):
+        """'342' -> LimbNumber, 9 characters per step. Time: O(n)"""
+        text = text.strip() or '0'
+        limbs = array('I', (
+            int(text[max(0, end - LIMB_DIGITS):end])
+            for end in range(len(text), 0, -LIMB_DIGITS)
+        ))
+        return cls(limbs)
+
+    def __str__(self):
+        """Time: O(n)"""
+        parts = [str(self.limbs[-1])]
+        parts.extend(f"{limb:09d}" for limb in reversed(self.limbs[:-1]))
+        return ''.join(parts)
+
+    @classmethod
+    def from_digits(cls, digits):
+        """Least significant digit first, like the linked lists: [2, 4, 3] -> 342"""
+        if np is not None:
+            padded = np.zeros(-(-len(digits) // LIMB_DIGITS) * LIMB_DIGITS, dtype=np.uint32)
+            padded[:len(digits)] = np.asarray(digits, dtype=np.uint32)
+            limbs = padded.reshape(-1, LIMB_DIGITS) @ _POWERS
+            return cls(array('I', limbs.astype(np.uint32).tobytes()))
+
+        limbs = array('I')
+        for start in range(0, len(digits), LIMB_DIGITS):
+            limb = 0
+            for digit in reversed(digits[start:start + LIMB_DIGITS]):
+                limb = limb * 10 + digit
+            limbs.append(limb)
+        return cls(limbs)
+
+    @classmethod
+    def from_linked_list(cls, head):
+        """ListNode chain (least significant digit first) -> LimbNumber"""
+        digits = array('B')
+        while head:
+            digits.append(head.val)
+            head = head.next
+        return cls.from_digits(digits)
+
+    def to_digits(self):
+        """Least significant digit first (what the linked list format needs)"""
+        text = str(self)
+        return [ord(char) - 48 for char in reversed(text)]
+
+    def to_linked_list(self, min_digits=0):
+        """
+        LimbNumber -> ListNode chain, built back to front (no dummy node)
+        min_digits pads with high-order zero nodes
+        """
+        head = None
+        for char in str(self).rjust(min_digits, '0'):  # most significant first
+            head = ListNode(ord(char) - 48, head)
+        return head
+
+    @classmethod
+    def from_int(cls, value):
+        """Small / medium ints only: repeated divmod is O(n^2) for huge ones"""
+        limbs = array('I')
+        while True:
+            value, limb = divmod(value, BASE)
+            limbs.append(limb)
+            if not value:
+                return cls(limbs)
+
+    def __int__(self):
+        value = 0
+        for limb in reversed(self.limbs):
+            value = value * BASE + limb
+        return value
+
+    def __eq__(self, other):
+        return isinstance(other, LimbNumber) and self.limbs == other.limbs
+
+    def __len__(self):
+        """Number of decimal digits"""
+        return (len(self.limbs) - 1) * LIMB_DIGITS + len(str(self.limbs[-1]))
+
+    def __repr__(self):
+        return f"LimbNumber({len(self)} digits)"
+
+    # ---------- addition ----------
+
+    def __add__(self, other):
+        if np is not None and min(len(self.limbs), len(other.limbs)) >= 64:
+            return LimbNumber(_add_numpy(self.limbs, other.limbs))
+        return LimbNumber(_add_python(self.limbs, other.limbs))
+
+
+def _add_python(a, b):
+    """
+    Schoolbook addition, one step per limb (9 digits)
+    Time: O(max(m, n) / 9), Space: O(max(m, n) / 9)
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    result = array('I', a)
+    carry = 0
+    for i, limb in enumerate(b):
+        total = result[i] + limb + carry
+        if total >= BASE:
+            result[i] = total - BASE
+            carry = 1
+        else:
+            result[i] = total
+            carry = 0
+    i = len(b)
+    while carry and i < len(result):
+        if result[i] == BASE - 1:
+            result[i] = 0
+        else:
+            result[i] += 1
+            carry = 0
+        i += 1
+    if carry:
+        result.append(1)
+    return result
+
+
+def _add_numpy(a, b):
+    """
+    Vectorized addition with carry-lookahead:
+    a limb *generates* a carry if a + b >= BASE, *propagates* an incoming
+    carry if a + b == BASE - 1, and *kills* it otherwise. Carry into limb i
+    is set when the closest generate-or-kill limb below i is a generate.
+    Time: O(n) in C
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    total = np.frombuffer(a, dtype=np.uint32).astype(np.int64)
+    total[:len(b)] += np.frombuffer(b, dtype=np.uint32)
+
+    generate = total >= BASE
+    total[generate] -= BASE
+    kill = ~generate & (total != BASE - 1)
+
+    index = np.arange(len(total))
+    last_decider = np.maximum.accumulate(np.where(generate | kill, index, -1))
+    carry_in = np.zeros(len(total) + 1, dtype=bool)
+    decided = last_decider >= 0
+    carry_in[1:][decided] = generate[last_decider[decided]]
+
+    total += carry_in[:-1]
+    total[total == BASE] = 0
+    result = array('I', total.astype(np.uint32).tobytes())
+    if carry_in[-1]:
+        result.append(1)
+    return result
+
+
+def _length(head):
+    length = 0
+    while head:
+        length += 1
+        head = head.next
+    return length
+
+
+def add_linked_lists(l1, l2):
+    """
+    Drop-in for addTwoNumbers: converts once, adds limbs, converts back.
+    Like addTwoNumbers, the result is as long as the longer input (plus a
+    final carry), high-order zeros included: [1, 0, 0] + [2] -> [3, 0, 0]
+    """
+    if l1 is None and l2 is None:
+        return None
+    total = LimbNumber.from_linked_list(l1) + LimbNumber.from_linked_list(l2)
+    return total.to_linked_list(min_digits=max(_length(l1), _length(l2)))
+
+
+# ---------- benchmark ----------
+
+def benchmark(digits=1_000_000):
+    """addTwoNumbers on ListNode chains vs LimbNumber addition, time and memory"""
+    import random
+    import time
+    import tracemalloc
+
+    from basics import addTwoNumbers, create_linked_list, linked_list_to_list
+
+    rng = random.Random(digits)
+    a_digits = [rng.randrange(10) for _ in range(digits)]
+    b_digits = [rng.randrange(10) for _ in range(digits)]
+
+    def measure(fn):
+        tracemalloc.start()
+        start = time.perf_counter()
+        value = fn()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return value, elapsed, peak / 2 ** 20
+
+    (l1, l2), list_build, list_mem = measure(lambda: (create_linked_list(a_digits), create_linked_list(b_digits)))
+    expected, list_add, list_add_mem = measure(lambda: addTwoNumbers(l1, l2))
+
+    (x, y), limb_build, limb_mem = measure(lambda: (LimbNumber.from_digits(a_digits), LimbNumber.from_digits(b_digits)))
+    python_sum, python_add, _ = measure(lambda: LimbNumber(_add_python(x.limbs, y.limbs)))
+    numpy_sum, numpy_add, numpy_add_mem = measure(lambda: x + y)
+
+    assert python_sum == numpy_sum
+    assert numpy_sum.to_digits() == linked_list_to_list(expected)
+
+    print(f"{digits:,} digit operands")
+    print(f"{'':<24} {'build':>9} {'memory':>10} {'add':>9} {'memory':>10}")
+    print(f"{'ListNode chains':<24} {list_build:>8.3f}s {list_mem:>8.1f}MB {list_add:>8.3f}s {list_add_mem:>8.1f}MB")
+    print(f"{'limbs, python add':<24} {limb_build:>8.3f}s {limb_mem:>8.1f}MB {python_add:>8.3f}s")
+    print(f"{'limbs, numpy add':<24} {'':>9} {'':>10} {numpy_add:>8.3f}s {numpy_add_mem:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    x = LimbNumber.from_linked_list(ListNode(2, ListNode(4, ListNode(3))))
+    y = LimbNumber.from_digits([5, 6, 4])
+    print((x + y).to_digits())  # Output: [7, 0, 8]
+    print(LimbNumber.from_str("999999999999999999") + LimbNumber.from_str("1"))
+
+    benchmark()
@@ -0,0 +1,207 @@
+#Longest substring without repeating characters - streaming version
+"""
+length_of_longest_substring_map() in basics.py needs the whole string in
+memory. UniqueSubstringScanner takes the input piece by piece (an iterator
+of chunks or a memory-mapped file) and keeps the sliding-window state
+between chunks, so a window can start in one chunk and end in the next.
+
+Byte input uses a fixed 256-entry "last seen at" table instead of a dict.
+With NumPy a whole chunk is processed at once:
+
+    prev[j]  = previous position of the same byte (radix-sorted by byte)
+    left[j]  = max(prev[0..j]) + 1          (running maximum)
+    length   = j - left[j] + 1
+
+Results are (length, start, end) with end exclusive, offsets counted from
+the beginning of the stream. On ties the earliest window wins.
+"""
+
+import mmap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class UniqueSubstringScanner:
+    def __init__(self, use_numpy=True):
+        self.use_numpy = use_numpy and np is not None
+        self.offset = 0        # stream position of the next chunk
+        self.left = 0          # stream position where the current window starts
+        self.best = (0, 0, 0)  # (length, start, end)
+        self.last_bytes = [-1] * 256
+        self.last_chars = {}   # for str chunks
+
+    def feed(self, chunk):
+        """Scan one chunk (bytes / bytearray / memoryview / str)"""
+        if isinstance(chunk, str):
+            self._feed_text(chunk)
+        elif self.use_numpy:
+            self._feed_numpy(chunk)
+        else:
+            self._feed_bytes(chunk)
+        self.offset += len(chunk)
+        return self
+
+    def result(self):
+        return self.best
+
+    # ---------- byte input ----------
+
+    def _feed_bytes(self, chunk):
+        """
+        Plain Python loop with the 256-entry table
+        Time: O(n), Space: O(1)
+        """
+        last = self.last_bytes
+        left = self.left
+        best_len, best_start, best_end = self.best
+        position = self.offset
+
+        for byte in bytes(chunk):
+            if last[byte] >= left:
+                left = last[byte] + 1
+            last[byte] = position
+            position += 1
+            if position - left > best_len:
+                best_len, best_start, best_end = position - left, left, position
+
+        self.left = left
+        self.best = (best_len, best_start, best_end)
+
+    def _feed_numpy(self, chunk):
+        """
+        Whole chunk at once
+        Time: O(n) (uint8 stable sort is a radix sort), Space: O(n)
+        """
+        data = np.frombuffer(chunk, dtype=np.uint8)
+        n = len(data)
+        if not n:
+            return
+
+        # work in chunk-local positions; earlier chunks become negative
+        last = np.array(self.last_bytes, dtype=np.int64) - self.offset
+
+        # previous occurrence of the same byte: neighbour in byte-sorted order,
+        # or the last position seen in earlier chunks for a byte's first occurrence
+        order = np.argsort(data, kind='stable')
+        sorted_bytes = data[order]
+        first_of_run = np.empty(n, dtype=bool)
+        first_of_run[0] = True
+        np.not_equal(sorted_bytes[1:], sorted_bytes[:-1], out=first_of_run[1:])
+        prev_sorted = np.empty(n, dtype=np.int64)
+        prev_sorted[1:] = order[:-1]
+        prev_sorted[first_of_run] = last[sorted_bytes[first_of_run]]
+        prev = np.empty(n, dtype=np.int64)
+        prev[order] = prev_sorted
+
+        prev += 1
+        np.maximum(prev, self.left - self.offset, out=prev)
+        left = np.maximum.accumulate(prev)
+        lengths = np.arange(1, n + 1) - left
+        j = int(lengths.argmax())
+        if lengths[j] > self.best[0]:
+            self.best = (int(lengths[j]), int(left[j]) + self.offset, j + 1 + self.offset)
+
+        last_of_run = np.empty(n, dtype=bool)
+        last_of_run[-1] = True
+        last_of_run[:-1] = first_of_run[1:]
+        last[sorted_bytes[last_of_run]] = order[last_of_run]
+        self.last_bytes = (last + self.offset).tolist()
+        self.left = int(left[-1]) + self.offset
+
+    # ---------- text input ----------
+
+    def _feed_text(self, chunk):
+        """Same window logic, dict keyed by character"""
+        last = self.last_chars
+        left = self.left
+        best_len, best_start, best_end = self.best
+        position = self.offset
+
+        for char in chunk:
+            seen = last.get(char, -1)
+            if seen >= left:
+                left = seen + 1
+            last[char] = position
+            position += 1
+            if position - left > best_len:
+                best_len, best_start, best_end = position - left, left, position
+
+        self.left = left
+        self.best = (best_len, best_start, best_end)
+
+
+def longest_unique_stream(chunks, use_numpy=True):
+    """(length, start, end) of the longest repeat-free run over an iterable of chunks"""
+    scanner = UniqueSubstringScanner(use_numpy)
+    for chunk in chunks:
+        scanner.feed(chunk)
+    return scanner.result()
+
+
+def longest_unique_file(path, chunk_size=1 << 24, use_numpy=True):
+    """Same, over a memory-mapped file read chunk_size bytes at a time"""
+    scanner = UniqueSubstringScanner(use_numpy)
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return scanner.result()
+        with mapped:
+            view = memoryview(mapped)
+            try:
+                for start in range(0, len(view), chunk_size):
+                    scanner.feed(view[start:start + chunk_size])
+            finally:
+                view.release()
+    return scanner.result()
+
+
+# ---------- benchmark ----------
+
+def benchmark(megabytes=(1, 8, 32), chunk_size=1 << 20):
+    """MB/s of basics.length_of_longest_substring_map vs the streaming scanner"""
+    import os
+    import random
+    import tempfile
+    import time
+
+    from basics import length_of_longest_substring_map
+
+    print(f"{'size':>6} {'basics (str)':>14} {'stream, python':>16} {'stream, numpy':>15} {'mmap file':>11}")
+    for mb in megabytes:
+        size = mb << 20
+        rng = random.Random(mb)
+        data = bytes(rng.choice(b"abcdefghijklmnopqrstuvwxyz0123456789 .,;:-_") for _ in range(size))
+        chunks = [data[i:i + chunk_size] for i in range(0, size, chunk_size)]
+
+        def rate(fn):
+            start = time.perf_counter()
+            value = fn()
+            return value, mb / (time.perf_counter() - start)
+
+        expected, basics_rate = rate(lambda: length_of_longest_substring_map(data.decode()))
+        python_result, python_rate = rate(lambda: longest_unique_stream(chunks, use_numpy=False))
+        numpy_result, numpy_rate = rate(lambda: longest_unique_stream(chunks))
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(data)
+        try:
+            file_result, file_rate = rate(lambda: longest_unique_file(f.name, chunk_size))
+        finally:
+            os.remove(f.name)
+
+        assert python_result == numpy_result == file_result and python_result[0] == expected
+        print(f"{mb:>4}MB {basics_rate:>10.1f}MB/s {python_rate:>12.1f}MB/s "
+              f"{numpy_rate:>11.1f}MB/s {file_rate:>7.1f}MB/s")
+
+
+if __name__ == "__main__":
+    for s in ["abcabcbb", "bbbbb", "pwwkew", "", " ", "au", "dvdf", "abba"]:
+        # split every string into 2-byte chunks to exercise chunk boundaries
+        chunks = [s.encode()[i:i + 2] for i in range(0, len(s), 2)]
+        print(repr(s), longest_unique_stream(chunks))
+    if np is not None:
+        benchmark()
@@ -0,0 +1,279 @@
+#Two Sum engine: index the array once, answer many targets
+"""
+two_sum() in basics.py rebuilds its dict on every call. When the same big
+array is queried again and again, it is cheaper to index it once:
+
+- NumPy path: sorted copy of the array and of its distinct values, plus
+  the first index of each value, so a whole batch of targets is answered
+  with np.searchsorted (or a direct lookup table when the values are
+  dense enough, e.g. ids or small ints)
+- pure Python path: value -> indices hash
+
+find() returns exactly what two_sum(nums, target) returns: the pair with
+the smallest right index j, and the latest left index i < j.
+
+NumPy is optional; without it the hash index is used.
+"""
+
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# how many (target x element) cells one vectorized step may use
+BATCH_CELLS = 1 << 22
+# use a lookup table when max - min <= DENSE_FACTOR * n
+DENSE_FACTOR = 8
+
+
+class TwoSumIndex:
+    def __init__(self, nums):
+        """
+        Time: O(n log n), Space: O(n)
+        """
+        self.nums = list(nums)
+        self.n = len(self.nums)
+
+        self.dense = None
+
+        if np is None or not self.n:
+            self.positions = {}  # value -> ascending list of indices
+            for i, num in enumerate(self.nums):
+                self.positions.setdefault(num, []).append(i)
+            self.first = {value: indices[0] for value, indices in self.positions.items()}
+            return
+
+        self.arr = np.asarray(self.nums)
+        self.order = np.argsort(self.arr, kind='stable')  # equal values keep index order
+        self.sorted = self.arr[self.order]
+        self.values, first, self.counts = np.unique(self.arr, return_index=True, return_counts=True)
+        self.first_index = first  # first index of each distinct value
+
+        # integer values in a small range: first index by direct lookup, no binary search
+        if self.arr.dtype.kind == 'i':
+            self.low = int(self.values[0])
+            span = int(self.values[-1]) - self.low + 1
+            if span <= DENSE_FACTOR * self.n:
+                self.dense = np.full(span, self.n, dtype=np.int64)
+                self.dense[self.values - self.low] = first
+
+    # ---------- two sum ----------
+
+    def _pair_for(self, target, j):
+        """Latest index i < j holding target - nums[j]"""
+        complement = target - self.nums[j]
+        if np is None:
+            indices = self.positions[complement]
+            return [indices[bisect_left(indices, j) - 1], j]
+        # indices of one value are a contiguous, ascending run of self.order
+        lo = int(np.searchsorted(self.sorted, complement, side='left'))
+        hi = int(np.searchsorted(self.sorted, complement, side='right'))
+        k = int(np.searchsorted(self.order[lo:hi], j))
+        return [int(self.order[lo + k - 1]), j]
+
+    def _first_indices(self, complements):
+        """First index of each complement value (n when it is not in the array)"""
+        # the lookup table is indexed by value, so only integer complements can use it
+        if self.dense is not None and complements.dtype.kind in 'iu':
+            offset = complements - self.low
+            inside = (offset >= 0) & (offset < len(self.dense))
+            return np.where(inside, self.dense[np.where(inside, offset, 0)], self.n)
+        pos = np.searchsorted(self.values, complements)
+        pos[pos == len(self.values)] = 0
+        return np.where(self.values[pos] == complements, self.first_index[pos], self.n)
+
+    def find(self, target):
+        """
+        Same answer as two_sum(nums, target), without rebuilding a dict
+        Time: O(n), Space: O(1) extra
+        """
+        if np is not None:
+            return self.find_many([target])[0]
+
+        for j, num in enumerate(self.nums):
+            i = self.first.get(target - num)
+            if i is not None and i < j:
+                return self._pair_for(target, j)
+        return []
+
+    def find_many(self, targets):
+        """
+        Answer many targets in one vectorized call.
+
+        j is scanned in growing blocks and a target leaves the batch as soon
+        as its pair is found, so (like two_sum) easy targets stop early.
+        Time: O(T * n log u) worst case, in C (u = distinct values)
+        Space: O(BATCH_CELLS)
+        """
+        targets = list(targets)
+        if np is None or self.n < 2:
+            return [self.find(t) if np is None else [] for t in targets]
+
+        answer_j = np.full(len(targets), -1)
+        active = np.arange(len(targets))
+        block_targets = np.asarray(targets)
+        start, size = 0, 256
+        while start < self.n and len(active):
+            size = max(1, min(size, BATCH_CELLS // len(active)))
+            stop = min(self.n, start + size)
+            complements = block_targets[active, None] - self.arr[None, start:stop]
+            # a pair (i, j) exists when the complement first appears before j
+            valid = self._first_indices(complements) < np.arange(start, stop)
+            has_pair = valid.any(axis=1)
+            answer_j[active[has_pair]] = start + valid[has_pair].argmax(axis=1)
+            active = active[~has_pair]
+            start, size = stop, size * 2
+
+        return [
+            self._pair_for(target, j) if j >= 0 else []
+            for target, j in zip(targets, answer_j.tolist())
+        ]
+
+    # ---------- counting ----------
+
+    def count_pairs(self, target):
+        """Number of index pairs i < j with nums[i] + nums[j] == target"""
+        return self.count_pairs_many([target])[0]
+
+    def count_pairs_many(self, targets):
+        """
+        Vectorized over the distinct values.
+        Time: O(T * u log u), Space: O(BATCH_CELLS)
+        """
+        targets = list(targets)
+        if np is None or not self.n:
+            return [self._count_pairs_py(t) for t in targets]
+
+        results = []
+        u = len(self.values)
+        counts = self.counts.astype(np.int64)
+        chunk = max(1, BATCH_CELLS // u)
+        for start in range(0, len(targets), chunk):
+            block = np.asarray(targets[start:start + chunk])
+            complements = block[:, None] - self.values[None, :]
+            pos = np.searchsorted(self.values, complements)
+            pos[pos == u] = 0
+            found = self.values[pos] == complements
+            # every unordered pair of distinct values is seen twice, equal values once
+            cross = np.where(found & (complements != self.values), counts * counts[pos], 0).sum(axis=1) // 2
+            same = np.where(found & (complements == self.values), counts * (counts - 1) // 2, 0).sum(axis=1)
+            results.extend((cross + same).tolist())
+        return results
+
+    def _count_pairs_py(self, target):
+        total = 0
+        for value, indices in self.positions.items():
+            other = self.positions.get(target - value)
+            if other is None:
+                continue
+            if target - value == value:
+                total += len(indices) * (len(indices) - 1) // 2
+            elif value < target - value:
+                total += len(indices) * len(other)
+        return total
+
+    # ---------- 3-sum / k-sum ----------
+
+    def three_sum(self, target):
+        return self.k_sum(target, 3)
+
+    def k_sum(self, target, k):
+        """
+        Indices (ascending) of k different elements adding up to target, or []
+        Sorted array + two pointers at the bottom of the recursion.
+        Time: O(n^(k-1)), Space: O(k)
+        """
+        if k < 2 or k > self.n:
+            return []
+        if np is not None:
+            values, order = self.sorted.tolist(), self.order.tolist()
+        else:
+            order = sorted(range(self.n), key=self.nums.__getitem__)
+            values = [self.nums[i] for i in order]
+
+        picked = self._k_sum_sorted(values, target, k, 0)
+        return sorted(order[p] for p in picked) if picked else []
+
+    def _k_sum_sorted(self, values, target, k, lo):
+        n = len(values)
+        if k == 2:
+            left, right = lo, n - 1
+            while left < right:
+                total = values[left] + values[right]
+                if total == target:
+                    return [left, right]
+                if total < target:
+                    left += 1
+                else:
+                    right -= 1
+            return None
+
+        for p in range(lo, n - k + 1):
+            if p > lo and values[p] == values[p - 1]:
+                continue  # same value, same sub-problem
+            # smallest / largest sums still reachable from here
+            if values[p] + sum(values[p + 1:p + k]) > target:
+                break
+            if values[p] + sum(values[n - k + 1:]) < target:
+                continue
+            rest = self._k_sum_sorted(values, target - values[p], k - 1, p + 1)
+            if rest:
+                return [p] + rest
+        return None
+
+
+# ---------- benchmark ----------
+
+def benchmark(max_exponent=7, queries=20):
+    """Repeated two_sum() calls vs one TwoSumIndex + find_many()"""
+    import random
+    import time
+
+    from basics import two_sum
+
+    print(f"{'n':>10} {'queries':>8} {'two_sum loop':>14} {'index build':>12} {'find_many':>10} {'speed-up':>9}")
+    for exponent in range(3, max_exponent + 1):
+        n = 10 ** exponent
+        q = queries if n <= 10 ** 5 else max(2, queries // 10)
+        nums = [2 * random.randrange(-n, n) for _ in range(n)]
+        # half the targets have a pair, the other half (odd) never do: full scans
+        targets = [random.choice(nums) + random.choice(nums) for _ in range(q // 2)]
+        targets += [2 * random.randrange(-n, n) + 1 for _ in range(q - q // 2)]
+
+        start = time.perf_counter()
+        expected = [two_sum(nums, t) for t in targets]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = TwoSumIndex(nums)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        answers = index.find_many(targets)
+        query_time = time.perf_counter() - start
+
+        assert answers == expected
+        print(f"{n:>10} {q:>8} {loop_time:>13.3f}s {build_time:>11.3f}s {query_time:>9.3f}s "
+              f"{loop_time / query_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    import sys
+
+    index = TwoSumIndex([2, 7, 11, 15, 7, -3])
+    print("find(9):", index.find(9))                       # [0, 1]
+    print("find_many([9, 14, 100]):", index.find_many([9, 14, 100]))
+    print("count_pairs(14):", index.count_pairs(14))       # (7, 7) once
+    print("three_sum(20):", index.three_sum(20))           # 2 + 7 + 11
+    print("k_sum(37, 4):", index.k_sum(37, 4))
+
+    from basics import two_sum
+
+    # float targets against an int array skip the lookup table
+    for nums, target in (([2, 7, 11, 15], 9.0), ([1, 2, 3], 4.5), ([1, 2, 3], 5.0)):
+        assert TwoSumIndex(nums).find(target) == two_sum(nums, target), (nums, target)
+    assert TwoSumIndex([1, 2, 3]).find_many([3, 4.5, 5.0]) == [two_sum([1, 2, 3], t) for t in (3, 4.5, 5.0)]
+
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
@@ -10,6 +10,7 @@ Comprehensive Python file demonstrating:
 # ========== MODULES AND IMPORTS ==========
 import math
 import json
+import itertools
 from datetime import datetime
 from collections import defaultdict
 
@@ -29,6 +30,11 @@ def format_user_data(name, age, city):
 
 def process_student_grades(students_dict):
     """Function that processes dictionary of students and their grades"""
+    if not students_dict:
+        # nothing to average (see grade_aggregator.py for the streaming version)
+        return {"total_students": 0, "average_grade": 0.0, "top_student": None,
+                "grades_summary": defaultdict(list)}
+
     results = {
         "total_students": len(students_dict),
         "average_grade": sum(students_dict.values()) / len(students_dict),
@@ -56,13 +62,14 @@ class Person:
     # Class variable (shared by all instances)
     species = "Homo sapiens"
     total_people = 0
+    _id_counter = itertools.count(1)  # timestamps collide when many are created at once
     
     def __init__(self, name, age, email):
         """Constructor - initialize object attributes"""
         self.name = name
         self.age = age
         self.email = email
-        self._id = f"P{datetime.now().timestamp()}"  # Private attribute
+        self._id = f"P{next(Person._id_counter)}"  # Private attribute
         Person.total_people += 1
     
     def introduce(self):
@@ -135,6 +142,13 @@ class Classroom:
             return True
         return False
     
+    def add_students(self, students):
+        """Add as many of the students (a list) as fit, return how many were added"""
+        free = self.capacity - len(self.students)
+        batch = students[:max(free, 0)]
+        self.students.extend(batch)
+        return len(batch)
+    
     def get_classroom_info(self):
         """Return classroom information as dictionary"""
         return {
@@ -0,0 +1,184 @@
+"""
+Bulk classroom allocation.
+
+Classroom.add_student places one student into one room, so spreading a
+cohort over many rooms means scanning the rooms for every student.
+allocate() places a whole list of students into many Classroom objects in
+one call, keyed on available seats (rooms already holding students are
+taken into account):
+
+- "least_loaded": every student goes to the room with the most free seats
+                  (rooms end up evenly filled)
+- "fill_first":   the fullest room that still has space is filled first
+                  (as few rooms as possible are opened)
+- "by_major":     students of one major are kept together, largest major
+                  first, each placed in the rooms with the most free seats
+
+Students are moved in slices (Classroom.add_students), not one by one,
+so the cost is O(S + R log R) instead of O(S * R) for a room scan per student.
+The result has a roster index: allocation.room_of[key] is O(1).
+"""
+
+import heapq
+from collections import defaultdict
+
+from basics2 import Classroom
+
+POLICIES = ("least_loaded", "fill_first", "by_major")
+
+
+class Allocation:
+    def __init__(self, key):
+        self.key = key
+        self.room_of = {}     # key(student) -> room_number
+        self.rosters = defaultdict(list)  # room_number -> students placed in this call
+        self.unplaced = []
+
+    def _place(self, room, students):
+        placed = room.add_students(students)
+        self.rosters[room.room_number].extend(students[:placed])
+        for student in students[:placed]:
+            self.room_of[self.key(student)] = room.room_number
+        return placed
+
+    def room_for(self, student):
+        """Room number of a student, None if it wasn't placed"""
+        return self.room_of.get(self.key(student))
+
+    def summary(self):
+        return {
+            "placed": len(self.room_of),
+            "unplaced": len(self.unplaced),
+            "rooms_used": len(self.rosters),
+        }
+
+
+def _free(room):
+    return room.capacity - len(room.students)
+
+
+def _least_loaded(allocation, students, rooms):
+    """
+    Same result as handing every student to the room with the most free
+    seats, computed as water-filling: binary search the free-seat level
+    every room is filled down to, then place each room's share as a slice.
+    Time: O(S + R log C) (C = largest capacity)
+    """
+    free = [_free(room) for room in rooms]
+    n = min(len(students), sum(f for f in free if f > 0))
+
+    def seats_above(level):
+        return sum(f - level for f in free if f > level)
+
+    lo, hi = 0, max(free, default=0)
+    while lo < hi:  # lowest level that doesn't overshoot n
+        mid = (lo + hi) // 2
+        if seats_above(mid) <= n:
+            hi = mid
+        else:
+            lo = mid + 1
+    extra = n - seats_above(lo)  # < rooms sitting at the level, one more each
+
+    position = 0
+    for i in sorted(range(len(rooms)), key=lambda i: -free[i]):
+        take = max(free[i] - lo, 0)
+        if extra and free[i] >= lo > 0:
+            take += 1
+            extra -= 1
+        if take:
+            allocation._place(rooms[i], students[position:position + take])
+            position += take
+    return position
+
+
+def _fill_first(allocation, students, rooms):
+    """Min-heap on free seats: top up the fullest open room before opening another"""
+    heap = [(_free(room), i) for i, room in enumerate(rooms) if _free(room) > 0]
+    heapq.heapify(heap)
+    position = 0
+    while position < len(students) and heap:
+        free, i = heapq.heappop(heap)
+        position += allocation._place(rooms[i], students[position:position + free])
+    return position
+
+
+def _by_major(allocation, students, rooms, major_of):
+    """Largest major first; each group goes into the emptiest rooms, in slices"""
+    groups = defaultdict(list)
+    for student in students:
+        groups[major_of(student)].append(student)
+
+    heap = [(-_free(room), i) for i, room in enumerate(rooms) if _free(room) > 0]
+    heapq.heapify(heap)
+    placed = 0
+    for major in sorted(groups, key=lambda m: -len(groups[m])):
+        group = groups[major]
+        position = 0
+        while position < len(group) and heap:
+            _, i = heapq.heappop(heap)
+            position += allocation._place(rooms[i], group[position:position + _free(rooms[i])])
+            if _free(rooms[i]) > 0:
+                heapq.heappush(heap, (-_free(rooms[i]), i))
+        placed += position
+        allocation.unplaced.extend(group[position:])
+    return placed
+
+
+def allocate(students, classrooms, policy="least_loaded", key=id, major_of=None):
+    """
+    Place many students into many classrooms in one call.
+    key(student) is what the roster index is keyed by (e.g. lambda s: s.student_id)
+    Returns an Allocation; students that didn't fit are in allocation.unplaced.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}, expected one of {POLICIES}")
+    students = list(students)
+    allocation = Allocation(key)
+
+    if policy == "by_major":
+        _by_major(allocation, students, classrooms, major_of or (lambda s: s.major))
+    else:
+        place = _least_loaded if policy == "least_loaded" else _fill_first
+        placed = place(allocation, students, classrooms)
+        allocation.unplaced = students[placed:]
+    return allocation
+
+
+def naive_allocate(students, classrooms):
+    """The per-student room scan that allocate() replaces (for the benchmark)"""
+    unplaced = []
+    for student in students:
+        for room in classrooms:
+            if room.add_student(student):
+                break
+        else:
+            unplaced.append(student)
+    return unplaced
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from basics2 import Student
+
+    n_students = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_rooms = max(1, n_students // 100)
+    majors = ["Computer Science", "Mathematics", "Physics", "Biology", "History"]
+    cohort = [Student(f"Student {i}", 20, f"s{i}@uni.edu", f"S{i}", random.choice(majors))
+              for i in range(n_students)]
+
+    for policy in POLICIES:
+        rooms = [Classroom(f"Room {r}", random.randint(80, 130)) for r in range(n_rooms)]
+        start = time.perf_counter()
+        result = allocate(cohort, rooms, policy, key=lambda s: s.student_id)
+        elapsed = time.perf_counter() - start
+        print(f"{policy:<13} {n_students:,} students, {n_rooms:,} rooms: {elapsed:.2f}s {result.summary()}")
+        print(f"{'':<13} S0 is in {result.room_of['S0']}")
+
+    small = cohort[:20_000]
+    rooms = [Classroom(f"Room {r}", 100) for r in range(len(small) // 100)]
+    start = time.perf_counter()
+    naive_allocate(small, rooms)
+    print(f"naive scan    {len(small):,} students, {len(rooms)} rooms: {time.perf_counter() - start:.2f}s")
@@ -11,5 +11,6 @@ def is_palindrome(num):
         return False
 
 # Example usage
-z = 121
-print(is_palindrome(z))
\ No newline at end of file
+if __name__ == "__main__":
+    z = 121
+    print(is_palindrome(z))
@@ -0,0 +1,238 @@
+"""
+Streaming, mergeable version of basics2.process_student_grades.
+
+process_student_grades needs the whole dict up front and walks it several
+times (sum, max, bucketing). GradeAggregator takes (student, grade) pairs
+one at a time from any iterable (dict items, a generator, a CSV file) and
+keeps everything in a single pass:
+
+    count, sum, min, max, top-K students, A/B/C/D bucket membership
+
+Two aggregators can be merged, so chunks can be processed in separate
+processes and combined into one result (see aggregate_parallel).
+"""
+
+import csv
+import heapq
+import math
+import os
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# lower bound of each letter, same cut-offs as process_student_grades
+BUCKETS = (("A", 90), ("B", 80), ("C", 70), ("D", float("-inf")))
+
+
+def grade_letter(grade):
+    for letter, lower in BUCKETS[:-1]:
+        if grade >= lower:
+            return letter
+    return BUCKETS[-1][0]  # everything else, NaN included, like process_student_grades' else branch
+
+
+class GradeAggregator:
+    """Partial state for one chunk of (student, grade) pairs"""
+
+    def __init__(self, top_k=3, keep_members=True):
+        self.top_k = top_k
+        self.keep_members = keep_members
+        self.count = 0
+        self.total = 0
+        self.min_grade = None
+        self.max_grade = None
+        self._top = []  # min-heap of (grade, -position, student), at most top_k items
+        self.bucket_counts = {letter: 0 for letter, _ in BUCKETS}
+        self.buckets = defaultdict(list)
+
+    # ---------- single pass ----------
+
+    def add(self, student, grade):
+        """Time: O(log k)"""
+        if self.count == 0:
+            self.min_grade = self.max_grade = grade
+        elif grade < self.min_grade:
+            self.min_grade = grade
+        elif grade > self.max_grade:
+            self.max_grade = grade
+
+        # earlier position wins ties, like max() in process_student_grades
+        entry = (grade, -self.count, student)
+        if len(self._top) < self.top_k:
+            heapq.heappush(self._top, entry)
+        elif self._top and entry > self._top[0]:  # top_k=0 keeps no top list
+            heapq.heapreplace(self._top, entry)
+
+        letter = grade_letter(grade)
+        self.bucket_counts[letter] += 1
+        if self.keep_members:
+            self.buckets[letter].append(student)
+
+        self.count += 1
+        self.total += grade
+        return self
+
+    def update(self, pairs):
+        for student, grade in pairs:
+            self.add(student, grade)
+        return self
+
+    # ---------- merging ----------
+
+    def merge(self, other):
+        """Fold another partial in; `other` counts as coming after self in the stream"""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.min_grade, self.max_grade = other.min_grade, other.max_grade
+        else:
+            self.min_grade = min(self.min_grade, other.min_grade)
+            self.max_grade = max(self.max_grade, other.max_grade)
+
+        shifted = [(grade, position - self.count, student) for grade, position, student in other._top]
+        self._top = heapq.nlargest(self.top_k, self._top + shifted)
+        heapq.heapify(self._top)
+
+        for letter, n in other.bucket_counts.items():
+            self.bucket_counts[letter] += n
+        for letter, students in other.buckets.items():
+            self.buckets[letter].extend(students)
+
+        self.count += other.count
+        self.total += other.total
+        return self
+
+    # ---------- results ----------
+
+    def top_students(self):
+        """[(student, grade)] best first"""
+        return [(student, grade) for grade, _, student in sorted(self._top, reverse=True)]
+
+    def results(self):
+        """Same keys as process_student_grades (plus min / max / top-K), safe when empty"""
+        top = self.top_students()
+        grades_summary = defaultdict(list)
+        for letter, _ in BUCKETS:
+            if self.buckets.get(letter):
+                grades_summary[letter] = self.buckets[letter]
+        return {
+            "total_students": self.count,
+            "average_grade": self.total / self.count if self.count else 0.0,
+            "top_student": top[0][0] if top else None,
+            "grades_summary": grades_summary,
+            "min_grade": self.min_grade,
+            "max_grade": self.max_grade,
+            "top_students": top,
+            "bucket_counts": dict(self.bucket_counts),
+        }
+
+
+# ---------- sources ----------
+
+def read_grade_csv(lines, has_header=True, student_column=0, grade_column=1):
+    """
+    Yield (student, grade) from CSV lines (an open file works), one row at a time
+    Raises ValueError for a row without a grade column or a grade that is
+    not a finite number ("nan", "inf")
+    """
+    rows = csv.reader(lines)
+    if has_header:
+        next(rows, None)
+    needed = max(student_column, grade_column) + 1
+    for row in rows:
+        if row:
+            if len(row) < needed:
+                raise ValueError(f"expected {needed} columns, got {len(row)}: {row!r}")
+            grade = float(row[grade_column])
+            if not math.isfinite(grade):
+                raise ValueError(f"grade is not a finite number: {row[grade_column]!r}")
+            yield row[student_column], grade
+
+
+def aggregate(pairs, top_k=3, keep_members=True):
+    return GradeAggregator(top_k, keep_members).update(pairs)
+
+
+def _aggregate_chunk(chunk, top_k, keep_members, csv_lines):
+    pairs = read_grade_csv(chunk, has_header=False) if csv_lines else chunk
+    return aggregate(pairs, top_k, keep_members)
+
+
+def aggregate_parallel(pairs, processes=None, chunk_size=100_000, top_k=3, keep_members=True,
+                       csv_lines=False):
+    """
+    Cut the stream into chunks, aggregate each chunk in a process pool and
+    merge the partials in stream order. At most 2 chunks per worker are in
+    flight, so the input is never fully loaded.
+    With csv_lines=True the items are raw CSV lines (no header) and the
+    parsing happens in the workers too.
+    """
+    processes = processes or os.cpu_count() or 1
+    items = iter(pairs)
+    chunks = iter(lambda: list(islice(items, chunk_size)), [])
+    result = GradeAggregator(top_k, keep_members)
+    with ProcessPoolExecutor(processes) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_aggregate_chunk, chunk, top_k, keep_members, csv_lines))
+            if len(pending) >= 2 * processes:
+                result.merge(pending.popleft().result())
+        while pending:
+            result.merge(pending.popleft().result())
+    return result
+
+
+def aggregate_csv_parallel(lines, has_header=True, **kwargs):
+    """aggregate_parallel over an open CSV file, parsed inside the workers"""
+    lines = iter(lines)
+    if has_header:
+        next(lines, None)
+    return aggregate_parallel(lines, csv_lines=True, **kwargs)
+
+
+# ---------- NumPy ----------
+
+def bucketize(grades, students=None):
+    """
+    Vectorized bucketing of an in-memory grade array.
+    Returns {letter: students (or indices) in that bucket}
+    """
+    grades = np.asarray(grades, dtype=float)
+    edges = [lower for _, lower in reversed(BUCKETS[:-1])]  # 70, 80, 90
+    letters = [letter for letter, _ in reversed(BUCKETS)]   # D, C, B, A
+    bins = np.digitize(grades, edges)
+    bins[np.isnan(grades)] = 0  # digitize puts NaN past the last edge (A); grade_letter says D
+    members = np.arange(len(grades)) if students is None else np.asarray(students)
+    return {letter: members[bins == i] for i, letter in enumerate(letters) if (bins == i).any()}
+
+
+if __name__ == "__main__":
+    import io
+    import json
+    import random
+    import time
+
+    grades = {"Alice": 85, "Bob": 92, "Charlie": 78, "Diana": 96, "Eve": 88, "Frank": 79, "Grace": 91}
+    print(json.dumps(aggregate(grades.items()).results(), indent=2))
+    print(aggregate({}.items()).results()["average_grade"])  # no ZeroDivisionError
+
+    csv_text = "student,grade\n" + "".join(f"s{i},{random.uniform(40, 100):.1f}\n" for i in range(1_000_000))
+    start = time.perf_counter()
+    single = aggregate(read_grade_csv(io.StringIO(csv_text)), keep_members=False)
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = aggregate_csv_parallel(io.StringIO(csv_text), keep_members=False)
+    parallel_time = time.perf_counter() - start
+
+    a, b = single.results(), parallel.results()
+    # float sums are added in a different order, compare the average loosely
+    assert abs(a.pop("average_grade") - b.pop("average_grade")) < 1e-9 and a == b
+    print(f"1M CSV rows: single pass {single_time:.2f}s, process pool {parallel_time:.2f}s")
+    if np is not None:
+        print({letter: len(m) for letter, m in bucketize([g for g in grades.values()], list(grades)).items()})
@@ -0,0 +1,172 @@
+#Palindrome numbers without strings, in bulk
+"""
+Faster relatives of exercise2.is_palindrome:
+
+- is_palindrome_arithmetic: reverses only the lower half of the number,
+  no string is built. (One by one in CPython it is still slower than the
+  C-level str slicing; it is the building block of the array version.)
+- is_palindrome_array: the same half-reversal on a whole NumPy int array
+- palindromes_in_range: builds the palindromes of a range directly from
+  their left halves instead of testing every integer (~2 * sqrt(hi) of
+  them exist below hi)
+- *_parallel: the same work split into chunks over a process pool
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def is_palindrome_arithmetic(num):
+    """
+    Reverse digits from the right until the reversed half catches up
+    Time: O(d) (d = digits), Space: O(1)
+    """
+    if num < 0 or (num % 10 == 0 and num != 0):
+        return False
+    reversed_half = 0
+    while num > reversed_half:
+        reversed_half = reversed_half * 10 + num % 10
+        num //= 10
+    # odd digit count: the middle digit sits at the end of reversed_half
+    return num == reversed_half or num == reversed_half // 10
+
+
+def is_palindrome_array(nums):
+    """
+    Vectorized half-reversal over an integer array -> bool array
+    Time: O(n * d) in C, at most ~10 passes for int64
+    """
+    x = np.asarray(nums, dtype=np.int64)
+    valid = (x >= 0) & ((x % 10 != 0) | (x == 0))
+    x = np.where(valid, x, 0)
+    reversed_half = np.zeros_like(x)
+
+    active = x > reversed_half
+    while active.any():
+        reversed_half = np.where(active, reversed_half * 10 + x % 10, reversed_half)
+        x = np.where(active, x // 10, x)
+        active = x > reversed_half
+
+    return valid & ((x == reversed_half) | (x == reversed_half // 10))
+
+
+def _mirror(half, odd):
+    """12, odd -> 121 ; 12, even -> 1221"""
+    result = half
+    if odd:
+        half //= 10
+    while half:
+        result = result * 10 + half % 10
+        half //= 10
+    return result
+
+
+def palindromes_in_range(lo, hi):
+    """
+    Yield every palindrome lo <= p <= hi in increasing order
+    Time: O(count * d), Space: O(1)
+    """
+    lo = max(lo, 0)
+    if lo > hi:
+        return
+    for length in range(len(str(lo)), len(str(hi)) + 1):
+        half_length = (length + 1) // 2
+        first = 10 ** (half_length - 1) if length > 1 else 0
+        last = 10 ** half_length - 1
+        # skip halves that can't reach the range
+        if length == len(str(lo)):
+            first = max(first, lo // 10 ** (length - half_length))
+        if length == len(str(hi)):
+            last = min(last, hi // 10 ** (length - half_length))
+        for half in range(first, last + 1):
+            p = _mirror(half, length % 2)
+            if p > hi:
+                return
+            if p >= lo:
+                yield p
+
+
+def _halves_chunks(lo, hi, chunk_size):
+    """Split [lo, hi] into sub-ranges that each hold about chunk_size palindromes"""
+    chunks = []
+    for length in range(len(str(max(lo, 0))), len(str(hi)) + 1):
+        half_length = (length + 1) // 2
+        start = max(lo, 10 ** (length - 1) if length > 1 else 0)
+        stop = min(hi, 10 ** length - 1)
+        if start > stop:
+            continue
+        step = 10 ** (length - half_length) * chunk_size  # chunk_size halves per chunk
+        for sub_lo in range(start, stop + 1, step):
+            chunks.append((sub_lo, min(stop, sub_lo + step - 1)))
+    return chunks
+
+
+def _collect(bounds):
+    return list(palindromes_in_range(*bounds))
+
+
+def _count(bounds):
+    return sum(1 for _ in palindromes_in_range(*bounds))
+
+
+def palindromes_in_range_parallel(lo, hi, processes=None, chunk_size=100_000):
+    """Sorted list of palindromes in [lo, hi], chunks generated in a process pool"""
+    with ProcessPoolExecutor(processes) as pool:
+        result = []
+        for part in pool.map(_collect, _halves_chunks(lo, hi, chunk_size)):
+            result.extend(part)
+    return result
+
+
+def count_palindromes_parallel(lo, hi, processes=None, chunk_size=1_000_000):
+    """Number of palindromes in [lo, hi] without keeping them in memory"""
+    with ProcessPoolExecutor(processes) as pool:
+        return sum(pool.map(_count, _halves_chunks(lo, hi, chunk_size)))
+
+
+def is_palindrome_bulk(ids, processes=None, chunk_size=1_000_000):
+    """is_palindrome_array over a huge id array, chunk by chunk in a process pool"""
+    ids = np.asarray(ids, dtype=np.int64)
+    if len(ids) <= chunk_size:
+        return is_palindrome_array(ids)
+    chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+    with ProcessPoolExecutor(processes) as pool:
+        return np.concatenate(list(pool.map(is_palindrome_array, chunks)))
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from exercise2 import is_palindrome
+
+    print(is_palindrome_arithmetic(121), is_palindrome_arithmetic(10), is_palindrome_arithmetic(-121))
+    print(list(palindromes_in_range(90, 200)))
+
+    ids = [random.randrange(10 ** 12) for _ in range(1_000_000)]
+    ids[::1000] = [p for p, _ in zip(palindromes_in_range(10 ** 11, 10 ** 12), range(len(ids[::1000])))]
+    id_array = np.array(ids, dtype=np.int64)
+
+    start = time.perf_counter()
+    expected = [is_palindrome(i) for i in ids]
+    string_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    arithmetic = [is_palindrome_arithmetic(i) for i in ids]
+    arithmetic_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = is_palindrome_array(id_array)
+    vector_time = time.perf_counter() - start
+
+    assert expected == arithmetic == vectorized.tolist()
+    print(f"1M ids: str {string_time:.2f}s, arithmetic {arithmetic_time:.2f}s, numpy {vector_time:.3f}s")
+
+    start = time.perf_counter()
+    count = count_palindromes_parallel(0, 10 ** 12)
+    print(f"palindromes in [0, 10^12]: {count} ({time.perf_counter() - start:.2f}s, "
+          f"vs testing 10^12 integers one by one)")
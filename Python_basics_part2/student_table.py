@@ -0,0 +1,264 @@
+"""
+Memory-lean students for millions of records.
+
+- SlimPerson / SlimStudent: same attributes and methods as Person / Student
+  in basics2.py, but with __slots__ (no per-instance __dict__)
+- StudentTable: one typed array per column instead of one object per
+  student. Course grades are stored as (row, course, grade) triples, so
+  GPA for every student is two np.bincount calls instead of a Python loop
+  per student. Enrolling again in the same course appends a new triple;
+  like Student.enroll_course, the last grade wins in every query.
+  Ids come from a counter, never from the clock.
+"""
+
+import itertools
+import sys
+from array import array
+
+import numpy as np
+
+from basics2 import Person, Student
+
+
+class SlimPerson:
+    __slots__ = ("name", "age", "email", "_id")
+
+    species = Person.species
+    __init__ = Person.__init__  # sets exactly the slot attributes
+    introduce = Person.introduce
+    is_adult = staticmethod(Person.is_adult)
+    __str__ = Person.__str__
+
+
+class SlimStudent(SlimPerson):
+    __slots__ = ("student_id", "major", "courses")
+
+    def __init__(self, name, age, email, student_id, major):
+        SlimPerson.__init__(self, name, age, email)
+        self.student_id = student_id
+        self.major = major
+        self.courses = {}
+
+    enroll_course = Student.enroll_course
+    calculate_gpa = Student.calculate_gpa
+    get_course_info = Student.get_course_info
+
+
+class StudentTable:
+    """Column store: row i of every column belongs to the same student"""
+
+    _id_counter = itertools.count(1)
+
+    def __init__(self):
+        # per-student columns
+        self.ids = array("q")
+        self.ages = array("H")
+        self.major_codes = array("H")
+        self.names = []
+        self.emails = []
+        self.student_ids = []
+        # enrollments, one entry per (student, course); NaN grade = not graded yet
+        self.enroll_rows = array("i")
+        self.enroll_courses = array("H")
+        self.enroll_grades = array("d")
+        # categorical lookups
+        self.majors = []
+        self.courses = []
+        self._major_code = {}
+        self._course_code = {}
+        self._latest_cache = (0, np.zeros(0, dtype=bool))  # (enrollments seen, mask of the latest ones)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @staticmethod
+    def _code(value, names, codes):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(names)
+            names.append(value)
+        return code
+
+    # ---------- adding rows ----------
+
+    def add_student(self, name, age, email, student_id, major):
+        """Returns the row number of the new student"""
+        self.ids.append(next(StudentTable._id_counter))
+        self.ages.append(age)
+        self.major_codes.append(self._code(major, self.majors, self._major_code))
+        self.names.append(name)
+        self.emails.append(email)
+        self.student_ids.append(student_id)
+        return len(self.ids) - 1
+
+    def add_students(self, names, ages, emails, student_ids, majors):
+        """Bulk insert; returns the range of new rows"""
+        start = len(self.ids)
+        self.names.extend(names)
+        self.emails.extend(emails)
+        self.student_ids.extend(student_ids)
+        self.ages.extend(ages)
+        self.major_codes.extend(self._code(m, self.majors, self._major_code) for m in majors)
+        self.ids.extend(itertools.islice(StudentTable._id_counter, len(self.names) - start))
+        return range(start, len(self.ids))
+
+    def enroll(self, row, course, grade=None):
+        """Same as Student.enroll_course: enrolling again replaces the grade"""
+        self.enroll_rows.append(row)
+        self.enroll_courses.append(self._code(course, self.courses, self._course_code))
+        self.enroll_grades.append(float("nan") if grade is None else grade)
+
+    def enroll_many(self, rows, courses, grades):
+        self.enroll_rows.extend(rows)
+        self.enroll_courses.extend(self._code(c, self.courses, self._course_code) for c in courses)
+        self.enroll_grades.extend(float("nan") if g is None else g for g in grades)
+
+    @classmethod
+    def from_students(cls, students):
+        table = cls()
+        for student in students:
+            row = table.add_student(student.name, student.age, student.email, student.student_id, student.major)
+            for course, grade in student.courses.items():
+                table.enroll(row, course, grade)
+        return table
+
+    # ---------- vectorized queries ----------
+
+    def _enrollments(self):
+        """Zero-copy NumPy views of the enrollment columns"""
+        return (
+            np.frombuffer(self.enroll_rows, dtype=np.int32),
+            np.frombuffer(self.enroll_courses, dtype=np.uint16),
+            np.frombuffer(self.enroll_grades, dtype=np.float64),
+        )
+
+    def _latest(self):
+        """
+        Mask of the enrollments not replaced by a later one of the same
+        (row, course). Enrollments are append-only, so it is cached until
+        the next enroll. Time: O(E log E) once
+        """
+        count, mask = self._latest_cache
+        if count != len(self.enroll_rows):
+            rows, courses, _ = self._enrollments()
+            keys = (rows.astype(np.int64) << 16) | courses
+            # first occurrence in reversed order = last occurrence
+            _, last = np.unique(keys[::-1], return_index=True)
+            mask = np.zeros(len(keys), dtype=bool)
+            mask[len(keys) - 1 - last] = True
+            self._latest_cache = (len(keys), mask)
+        return mask
+
+    def gpa(self):
+        """
+        GPA of every student at once (0.0 without graded courses, like calculate_gpa)
+        Time: O(students + enrollments) in C (plus _latest after new enrollments)
+        """
+        rows, _, grades = self._enrollments()
+        graded = self._latest() & ~np.isnan(grades)
+        n = len(self.ids)
+        totals = np.bincount(rows[graded], weights=grades[graded], minlength=n)
+        counts = np.bincount(rows[graded], minlength=n)
+        return np.divide(totals, counts, out=np.zeros(n), where=counts > 0)
+
+    def course_counts(self):
+        """Number of enrolled courses per student"""
+        rows, _, _ = self._enrollments()
+        return np.bincount(rows[self._latest()], minlength=len(self.ids))
+
+    def get_course_info(self, row):
+        """Same dict as Student.get_course_info for one row"""
+        rows, courses, grades = self._enrollments()
+        mine = np.flatnonzero(rows == row)
+        details = {
+            self.courses[c]: (None if np.isnan(g) else float(g))
+            for c, g in zip(courses[mine].tolist(), grades[mine].tolist())
+        }
+        graded = [g for g in details.values() if g is not None]
+        return {
+            "student_id": self.student_ids[row],
+            "name": self.names[row],
+            "major": self.majors[self.major_codes[row]],
+            "courses_enrolled": len(details),
+            "gpa": sum(graded) / len(graded) if graded else 0.0,
+            "course_details": details,
+        }
+
+    def memory_usage(self):
+        """Approximate bytes used by the columns (strings included)"""
+        typed = sum(column.itemsize * len(column) for column in (
+            self.ids, self.ages, self.major_codes,
+            self.enroll_rows, self.enroll_courses, self.enroll_grades,
+        ))
+        strings = sum(sys.getsizeof(column) + sum(map(sys.getsizeof, column))
+                      for column in (self.names, self.emails, self.student_ids))
+        return typed + strings
+
+
+# ---------- benchmark ----------
+
+def benchmark(n=1_000_000, courses_per_student=5):
+    """Student objects vs SlimStudent objects vs StudentTable: memory and GPA time"""
+    import random
+    import time
+    import tracemalloc
+
+    rng = random.Random(n)
+    majors = ["Computer Science", "Mathematics", "Physics", "Biology", "History"]
+    catalog = [f"Course {i}" for i in range(200)]
+    rows = [
+        (f"Student {i}", rng.randint(17, 30), f"s{i}@uni.edu", f"S{i}", rng.choice(majors),
+         [(rng.choice(catalog), rng.choice([None, rng.uniform(50, 100)])) for _ in range(courses_per_student)])
+        for i in range(n)
+    ]
+
+    def build_objects(cls):
+        students = []
+        for name, age, email, student_id, major, enrollments in rows:
+            student = cls(name, age, email, student_id, major)
+            for course, grade in enrollments:
+                student.enroll_course(course, grade)
+            students.append(student)
+        return students
+
+    def build_table():
+        table = StudentTable()
+        table.add_students(*(list(column) for column in zip(*(row[:5] for row in rows))))
+        flat = [(i, course, grade) for i, row in enumerate(rows) for course, grade in row[5]]
+        table.enroll_many(*zip(*flat))
+        return table
+
+    def measure(build, gpa):
+        tracemalloc.start()
+        start = time.perf_counter()
+        built = build()
+        build_time = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0] / 2 ** 20
+        tracemalloc.stop()
+        start = time.perf_counter()
+        result = gpa(built)
+        return build_time, memory, time.perf_counter() - start, result
+
+    print(f"{n:,} students, {courses_per_student} courses each")
+    print(f"{'':<16} {'build':>8} {'memory':>10} {'all GPAs':>9}")
+    results = {}
+    for label, build, gpa in (
+        ("Student", lambda: build_objects(Student), lambda s: [x.calculate_gpa() for x in s]),
+        ("SlimStudent", lambda: build_objects(SlimStudent), lambda s: [x.calculate_gpa() for x in s]),
+        ("StudentTable", build_table, lambda t: t.gpa()),
+    ):
+        build_time, memory, gpa_time, results[label] = measure(build, gpa)
+        print(f"{label:<16} {build_time:>7.2f}s {memory:>8.1f}MB {gpa_time:>8.3f}s")
+
+    assert np.allclose(results["Student"], results["StudentTable"])
+
+    # students without courses: 0.0 like calculate_gpa, no enrollments at all included
+    empty = StudentTable.from_students([Student("No Courses", 20, "none@uni.edu", "S0", "History")])
+    assert empty.gpa().tolist() == [0.0] and empty.course_counts().tolist() == [0]
+    assert len(StudentTable.from_students([]).gpa()) == 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
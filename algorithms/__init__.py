@@ -0,0 +1,66 @@
+"""
+The exercise modules as one importable library.
+
+    from algorithms import two_sum, TwoSumIndex
+    from algorithms import basics2
+
+Nothing is imported up front: a submodule (and NumPy, for the ones that
+use it) is loaded the first time one of its names is used, so
+`import algorithms` costs about as much as an empty module.
+The modules stay where they are (Python_basics_part1 / Python_basics_part2,
+which import each other by plain module name); their directories are put
+on sys.path when the first one is loaded.
+
+Import time:  python -m algorithms import-time
+Bulk CLI:     python -m algorithms --help
+"""
+
+import importlib
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DIRECTORIES = [os.path.join(_ROOT, "Python_basics_part1"), os.path.join(_ROOT, "Python_basics_part2")]
+
+# submodule -> names it exports at package level
+_EXPORTS = {
+    "basics": ["two_sum", "ListNode", "addTwoNumbers", "create_linked_list", "linked_list_to_list",
+               "length_of_longest_substring_map"],
+    "exercise2": ["is_palindrome"],
+    "basics2": ["calculate_circle_area", "format_user_data", "process_student_grades",
+                "Person", "Student", "Classroom"],
+    "two_sum_engine": ["TwoSumIndex"],
+    "longest_substring_stream": ["UniqueSubstringScanner", "longest_unique_stream", "longest_unique_file"],
+    "big_number": ["LimbNumber", "add_linked_lists"],
+    "palindrome_engine": ["is_palindrome_arithmetic", "is_palindrome_array", "palindromes_in_range",
+                          "count_palindromes_parallel", "is_palindrome_bulk"],
+    "grade_aggregator": ["GradeAggregator", "aggregate", "aggregate_parallel", "read_grade_csv", "bucketize"],
+    "student_table": ["SlimPerson", "SlimStudent", "StudentTable"],
+    "classroom_scheduler": ["allocate"],
+}
+_OWNER = {name: module for module, names in _EXPORTS.items() for name in names}
+
+SUBMODULES = tuple(_EXPORTS)
+__all__ = [*SUBMODULES, *_OWNER]
+
+
+def _load(module):
+    for directory in _DIRECTORIES:
+        if directory not in sys.path:
+            sys.path.append(directory)
+    return importlib.import_module(module)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = _load(name)
+    elif name in _OWNER:
+        value = getattr(_load(_OWNER[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
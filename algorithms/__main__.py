@@ -0,0 +1,5 @@
+import sys
+
+from algorithms.cli import main
+
+sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+Bulk CLI: one process streams a whole file of inputs.
+
+Every command reads its input line by line (a file, or stdin with "-")
+and writes one output line per input line, so results line up with the
+queries and nothing is held in memory beyond the current line.
+
+    two-sum            "<target> <num> <num> ..."      -> "[i, j]" ([] if no pair)
+    add                "<digits> <digits>"             -> digits of the sum
+                       (least significant digit first, like the linked lists)
+    longest-substring  any text                        -> length of the longest
+                                                          substring without repeats
+    palindrome         "<integer>"                     -> true / false
+    grades             CSV "student,grade" rows        -> one JSON summary
+    import-time        (no input)                      -> import cost of each submodule
+
+Example:
+    printf '9 2 7 11 15\\n6 3 2 4\\n' | python -m algorithms two-sum
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import algorithms
+
+
+def _numbers(line):
+    return [int(token) for token in line.replace(",", " ").split()]
+
+
+def two_sum_line(line):
+    target, *nums = _numbers(line)
+    return json.dumps(algorithms.two_sum(nums, target))
+
+
+def add_line(line):
+    a, b = line.split()
+    total = algorithms.addTwoNumbers(algorithms.create_linked_list([int(d) for d in a]),
+                                     algorithms.create_linked_list([int(d) for d in b]))
+    return "".join(map(str, algorithms.linked_list_to_list(total)))
+
+
+def longest_substring_line(line):
+    return str(algorithms.length_of_longest_substring_map(line))
+
+
+def palindrome_line(line):
+    return "true" if algorithms.is_palindrome(int(line)) else "false"
+
+
+LINE_COMMANDS = {
+    "two-sum": two_sum_line,
+    "add": add_line,
+    "longest-substring": longest_substring_line,
+    "palindrome": palindrome_line,
+}
+
+
+def _open_input(path):
+    return sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+
+
+def _open_output(path):
+    return sys.stdout if path == "-" else open(path, "w", encoding="utf-8", buffering=1 << 20)
+
+
+def run_lines(handler, lines, out):
+    """Apply handler to every line; a bad line stops the run with its line number"""
+    count = 0
+    for count, line in enumerate(lines, 1):
+        line = line.rstrip("\r\n")
+        try:
+            out.write(handler(line) if line else "")
+        except ValueError as e:
+            raise SystemExit(f"line {count}: {e}")
+        out.write("\n")
+    return count
+
+
+def run_grades(lines, out, has_header, top_k, members):
+    """One JSON summary; a bad row stops the run with its line number, like run_lines"""
+    line_number = 0
+
+    def counted():
+        nonlocal line_number
+        for line_number, line in enumerate(lines, 1):
+            yield line
+
+    try:
+        aggregator = algorithms.aggregate(algorithms.read_grade_csv(counted(), has_header), top_k, members)
+    except ValueError as e:
+        raise SystemExit(f"line {line_number}: {e}")
+    json.dump(aggregator.results(), out, indent=2)
+    out.write("\n")
+    return aggregator.count
+
+
+def import_times():
+    """Seconds to import the package and then each submodule, in a fresh interpreter each"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = ("import time; start = time.perf_counter(); import algorithms; {access}; "
+            "print(time.perf_counter() - start)")
+    results = {}
+    for label, access in [("algorithms", "pass")] + [(m, f"algorithms.{m}") for m in algorithms.SUBMODULES]:
+        output = subprocess.run([sys.executable, "-c", code.format(access=access)],
+                                cwd=root, capture_output=True, text=True, check=True).stdout
+        results[label] = float(output)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m algorithms", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name in [*LINE_COMMANDS, "grades"]:
+        command = commands.add_parser(name)
+        command.add_argument("input", nargs="?", default="-", help="input file (default: stdin)")
+        command.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+        command.add_argument("--stats", action="store_true", help="print lines/s to stderr")
+        if name == "grades":
+            command.add_argument("--no-header", dest="has_header", action="store_false")
+            command.add_argument("--top", type=int, default=3)
+            command.add_argument("--members", action="store_true", help="list the students of every letter")
+    commands.add_parser("import-time")
+    args = parser.parse_args(argv)
+
+    if args.command == "import-time":
+        for label, seconds in import_times().items():
+            print(f"{label:<26} {seconds * 1e3:8.2f}ms")
+        return 0
+
+    start = time.perf_counter()
+    source, out = _open_input(args.input), _open_output(args.output)
+    try:
+        if args.command == "grades":
+            count = run_grades(source, out, args.has_header, args.top, args.members)
+        else:
+            count = run_lines(LINE_COMMANDS[args.command], source, out)
+    finally:
+        out.flush()
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        print(f"{count:,} lines in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} lines/s)", file=sys.stderr)
+    return 0
@@ -0,0 +1,207 @@
+"""
+Scaling benchmarks for the algorithm functions, with a stored baseline.
+
+Each case runs one function over generated inputs of growing size, keeps
+the best time per size, and fits time ~ c * n^k on a log-log scale. The
+results are written to / compared against a JSON baseline:
+
+- a case missing from the baseline file: its run is saved as the baseline
+- otherwise: a case fails when its time at any size is more than
+  --threshold (default 0.25 = 25%) above the baseline, or when the fitted
+  exponent grew by more than --exponent-threshold (default 0.2)
+- --save overwrites the baseline with this run
+
+Baselines are machine specific: save one on the machine that compares.
+
+Run:  python benchmarks/bench_scaling.py [--only two_sum ...] [--max-size 100000]
+      python benchmarks/bench_scaling.py --save
+      python benchmarks/bench_scaling.py --plot scaling.png   (needs matplotlib)
+Exit status is 1 when something regressed.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "Python_basics_part1"), os.path.join(ROOT, "Python_basics_part2")]
+
+from basics import addTwoNumbers, create_linked_list, length_of_longest_substring_map, two_sum  # noqa: E402
+from basics2 import Student, process_student_grades  # noqa: E402
+from exercise2 import is_palindrome  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+MIN_REPEAT_SECONDS = 0.05  # each measurement loops the call until it takes at least this long
+
+
+# ---------- generated inputs (built outside the timed call) ----------
+
+def two_sum_input(n, rng):
+    # worst case: the only pair is the last two numbers
+    nums = list(range(n - 2))
+    rng.shuffle(nums)
+    nums += [n - 2, n - 1]
+    return (nums, nums[-1] + nums[-2]), {}
+
+
+def add_two_numbers_input(n, rng):
+    return (create_linked_list([rng.randrange(10) for _ in range(n)]),
+            create_linked_list([rng.randrange(10) for _ in range(n)])), {}
+
+
+def longest_substring_input(n, rng):
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789"
+    return ("".join(rng.choice(alphabet) for _ in range(n)),), {}
+
+
+def palindrome_input(n, rng):
+    # n = number of digits; int -> str is limited to 4300 digits by default
+    half = "".join(rng.choice("123456789") for _ in range(n // 2))
+    return (int(half + half[::-1]),), {}
+
+
+def grades_input(n, rng):
+    return ({f"student{i}": rng.uniform(40, 100) for i in range(n)},), {}
+
+
+def gpa_input(n, rng):
+    student = Student("Bench", 20, "bench@uni.edu", "S1", "Computer Science")
+    for i in range(n):
+        student.enroll_course(f"Course {i}", rng.choice([None, rng.uniform(50, 100)]))
+    return (student,), {}
+
+
+CASES = {
+    # name: (function, input builder, sizes)
+    "two_sum": (two_sum, two_sum_input, [1_000, 10_000, 100_000, 1_000_000]),
+    "addTwoNumbers": (addTwoNumbers, add_two_numbers_input, [1_000, 10_000, 100_000, 1_000_000]),
+    "length_of_longest_substring_map": (length_of_longest_substring_map, longest_substring_input,
+                                        [1_000, 10_000, 100_000, 1_000_000]),
+    "is_palindrome": (is_palindrome, palindrome_input, [64, 256, 1_024, 4_096]),
+    "process_student_grades": (process_student_grades, grades_input, [1_000, 10_000, 100_000, 1_000_000]),
+    "Student.calculate_gpa": (Student.calculate_gpa, gpa_input, [1_000, 10_000, 100_000, 1_000_000]),
+}
+
+
+# ---------- measuring ----------
+
+def best_time(fn, args, kwargs, repeat):
+    """Best seconds per call out of `repeat` measurements (like timeit)"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_REPEAT_SECONDS:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(*args, **kwargs)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def fit_power_law(sizes, seconds):
+    """Least squares on log(t) = log(c) + k * log(n) -> (k, c)"""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in seconds]
+    if len(xs) < 2:
+        return 0.0, seconds[0] if seconds else 0.0
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    k = (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+         / sum((x - mean_x) ** 2 for x in xs))
+    return k, math.exp(mean_y - k * mean_x)
+
+
+def run_case(name, max_size, repeat):
+    fn, build, sizes = CASES[name]
+    sizes = [n for n in sizes if n <= max_size] or sizes[:1]
+    rng = random.Random(name)  # same inputs on every run
+    seconds = []
+    for n in sizes:
+        args, kwargs = build(n, rng)
+        seconds.append(best_time(fn, args, kwargs, repeat))
+    exponent, constant = fit_power_law(sizes, seconds)
+    return {"sizes": sizes, "seconds": seconds, "exponent": exponent, "constant": constant}
+
+
+# ---------- baseline ----------
+
+def compare(name, current, baseline, threshold, exponent_threshold):
+    """List of regression messages for one case (empty = ok)"""
+    problems = []
+    previous = dict(zip(baseline["sizes"], baseline["seconds"]))
+    for n, seconds in zip(current["sizes"], current["seconds"]):
+        if n in previous and seconds > previous[n] * (1 + threshold):
+            problems.append(f"{name} n={n:,}: {seconds * 1e3:.3f}ms vs baseline "
+                            f"{previous[n] * 1e3:.3f}ms (+{seconds / previous[n] - 1:.0%})")
+    if current["exponent"] > baseline["exponent"] + exponent_threshold:
+        problems.append(f"{name}: scaling exponent {current['exponent']:.2f} vs baseline "
+                        f"{baseline['exponent']:.2f}")
+    return problems
+
+
+def plot(results, path):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    for name, result in results.items():
+        ax.loglog(result["sizes"], result["seconds"], "o-", label=f"{name} (n^{result['exponent']:.2f})")
+    ax.set_xlabel("input size n")
+    ax.set_ylabel("seconds per call")
+    ax.legend(fontsize="small")
+    fig.savefig(path, bbox_inches="tight")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), help="cases to run (default: all)")
+    parser.add_argument("--max-size", type=int, default=10 ** 9, help="skip sizes above this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown per size (0.25 = 25%%)")
+    parser.add_argument("--exponent-threshold", type=float, default=0.2)
+    parser.add_argument("--save", action="store_true", help="write this run as the new baseline")
+    parser.add_argument("--plot", metavar="PNG", help="save a log-log plot of the curves")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results, problems = {}, []
+    for name in args.only or CASES:
+        results[name] = result = run_case(name, args.max_size, args.repeat)
+        timings = "  ".join(f"{n:,}: {t * 1e3:.3f}ms" for n, t in zip(result["sizes"], result["seconds"]))
+        print(f"{name:<32} ~n^{result['exponent']:.2f}  {timings}")
+        if name in baseline and not args.save:
+            problems += compare(name, result, baseline[name], args.threshold, args.exponent_threshold)
+
+    if args.plot:
+        plot(results, args.plot)
+
+    new = results if args.save else {name: r for name, r in results.items() if name not in baseline}
+    if new:
+        baseline.update(new)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+
+    for problem in problems:
+        print("REGRESSION", problem)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
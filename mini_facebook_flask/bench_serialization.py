@@ -0,0 +1,68 @@
+"""
+Serialization throughput for 10k-row list payloads.
+
+Compares the old path (full ORM objects + to_dict + stdlib json) with the
+projected path (column tuples + rows_to_dicts + orjson when installed).
+
+Run:  python bench_serialization.py
+(uses an in-memory SQLite database, MySQL is not needed)
+"""
+
+import json
+import os
+import time
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+
+from app import app, db, User, Post, Comment  # noqa: E402
+from serializers import orjson, parse_fields, project, rows_to_dicts  # noqa: E402
+
+ROWS = 10_000
+REPEAT = 5
+
+
+def seed():
+    user = User(name='Bench', email='bench@example.com', bio='')
+    db.session.add(user)
+    db.session.flush()
+    posts = [Post(user_id=user.id, title=f'Post {i}', content='x' * 200) for i in range(ROWS)]
+    db.session.add_all(posts)
+    db.session.flush()
+    db.session.add_all(Comment(post_id=posts[0].id, user_id=user.id, content=f'c{i}') for i in range(ROWS))
+    db.session.commit()
+
+
+def timed(label, fn):
+    best = float('inf')
+    for _ in range(REPEAT):
+        db.session.expunge_all()  # cold identity map, like a new request
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<45} {best * 1000:8.1f} ms  ({ROWS / best:,.0f} rows/s)")
+
+
+def orm_path(model, query):
+    return json.dumps([obj.to_dict() for obj in query.all()])
+
+
+def projected_path(model, query, raw_fields=None):
+    names = parse_fields(model, raw_fields)
+    rows = rows_to_dicts(project(query, model, names).all(), model, names)
+    return app.json.dumps(rows)
+
+
+def main():
+    with app.app_context():
+        seed()
+        print(f"JSON encoder: {'orjson' if orjson else 'stdlib json'}\n")
+        for model, query in ((Post, Post.query), (Comment, Comment.query)):
+            name = model.__name__
+            timed(f"{name}: ORM + to_dict + json", lambda: orm_path(model, query))
+            timed(f"{name}: projection, all fields", lambda: projected_path(model, query))
+            timed(f"{name}: projection, ?fields=id,content", lambda: projected_path(model, query, 'id,content'))
+            print()
+
+
+if __name__ == '__main__':
+    main()
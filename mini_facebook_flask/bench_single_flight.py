@@ -0,0 +1,77 @@
+"""
+Concurrency check for single-flight reads.
+
+Seeds one "viral" post, then fires many concurrent requests at
+get_like_count / get_post_by_id / get_post_comments from a thread pool.
+Every response must be identical, and fewer queries than requests must
+have run (the counters show how many were coalesced onto another
+request's query).
+
+Run:  python bench_single_flight.py
+(uses a temporary SQLite file, MySQL is not needed)
+"""
+
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+db_file = os.path.join(tempfile.mkdtemp(), 'single_flight.db')
+os.environ.setdefault('DATABASE_URL', f'sqlite:///{db_file}')
+
+from app import app, db, reads, User, Post, Comment, Like  # noqa: E402
+
+REQUESTS = 2_000
+THREADS = 64
+COMMENTS = 2_000
+LIKERS = 2_000
+
+
+def seed():
+    with app.app_context():
+        db.session.add_all(User(name=f'u{i}', email=f'u{i}@example.com') for i in range(LIKERS))
+        db.session.flush()
+        post = Post(user_id=1, title='Viral', content='...')
+        db.session.add(post)
+        db.session.flush()
+        db.session.add_all(Comment(post_id=post.id, user_id=1, content=f'c{i}') for i in range(COMMENTS))
+        db.session.add_all(Like(post_id=post.id, user_id=i + 1) for i in range(LIKERS))
+        db.session.commit()
+        return post.id
+
+
+def hammer(url):
+    client = app.test_client()
+
+    def one_request(_):
+        response = client.get(url)
+        assert response.status_code == 200, response.status_code
+        return response.get_data()
+
+    before = reads.stats()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        bodies = set(pool.map(one_request, range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+    after = reads.stats()
+
+    assert len(bodies) == 1, f"{url}: {len(bodies)} different responses"
+    executed = after['executed'] - before['executed']
+    coalesced = after['coalesced'] - before['coalesced']
+    cached = after['cache_hits'] - before['cache_hits']
+    assert executed < REQUESTS, f"{url}: every request ran its own query, nothing was coalesced"
+    print(f"{url:<28} {REQUESTS} requests in {elapsed:6.2f}s  "
+          f"queries: {executed:5}  coalesced: {coalesced:5}  cache hits: {cached:5}")
+
+
+def main():
+    post_id = seed()
+    print(f"{THREADS} threads, micro-TTL = {reads.ttl}s\n")
+    hammer(f'/posts/{post_id}/likes/count')
+    hammer(f'/posts/{post_id}')
+    hammer(f'/posts/{post_id}/comments')
+    print(f"\ntotals: {reads.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+On-demand sampling profiler for admins.
+
+GET /debug/profile?seconds=N samples the Python stack of every thread that
+is inside a route for N seconds and returns collapsed stacks, one line per
+distinct stack, rooted at the route it belongs to:
+
+    /users/<int:user_id>/friends;app.py:show_friends;query.py:all;... 42
+
+Feed it to flamegraph.pl / speedscope / inferno as is.
+
+Nothing runs between profiles: no hooks, no tracing. While a profile is
+being taken the requesting thread wakes up `hz` times a second and reads
+sys._current_frames(); the profiled threads are never interrupted.
+
+admin_required guards this and the other /debug endpoints.
+
+Config:
+    PROFILER_TOKEN        admin token for /debug/*; requests must send it in
+                          the X-Admin-Token header (profiler off and other
+                          debug endpoints 404 when not set)
+    PROFILER_MAX_SECONDS  longest allowed profile (default 60)
+"""
+
+import functools
+import hmac
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from flask import Response, abort, current_app, jsonify, request
+
+TOKEN_HEADER = 'X-Admin-Token'
+DEFAULT_HZ = 100
+MAX_HZ = 1000
+
+
+def _label(code):
+    # ';' separates frames in the collapsed format
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}".replace(';', ',')
+
+
+class StackSampler:
+    """Samples the threads currently running one of the given view functions"""
+
+    def __init__(self, routes_by_code):
+        self.routes_by_code = routes_by_code  # view function code -> URL rule
+        self.stacks = Counter()               # (route, codes outermost first) -> samples
+        self.ticks = 0
+
+    def sample(self, skip_thread):
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == skip_thread:
+                continue
+            codes = []
+            while frame is not None:
+                code = frame.f_code
+                codes.append(code)
+                route = self.routes_by_code.get(code)
+                if route is not None:
+                    codes.reverse()
+                    self.stacks[route, tuple(codes)] += 1
+                    break
+                frame = frame.f_back
+        self.ticks += 1
+
+    def run(self, seconds, hz):
+        me = threading.get_ident()
+        interval = 1.0 / hz
+        deadline = time.perf_counter() + seconds
+        next_tick = time.perf_counter()
+        while next_tick < deadline:
+            self.sample(me)
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+        return self
+
+    def collapsed(self):
+        """flamegraph.pl input, grouped by route (busiest route first)"""
+        per_route = Counter()
+        for (route, _), count in self.stacks.items():
+            per_route[route] += count
+        lines = []
+        for (route, codes), count in sorted(self.stacks.items(),
+                                            key=lambda item: (-per_route[item[0][0]], -item[1])):
+            lines.append(';'.join([route, *map(_label, codes)]) + f' {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def admin_required(view):
+    """404 when no admin token is configured, 403 unless the request carries it"""
+    @functools.wraps(view)
+    def guarded(*args, **kwargs):
+        token = current_app.config.get('PROFILER_TOKEN')
+        if not token:
+            abort(404)
+        # bytes: compare_digest rejects non-ASCII str
+        if not hmac.compare_digest(request.headers.get(TOKEN_HEADER, '').encode(), token.encode()):
+            return jsonify({'error': 'Admin token required'}), 403
+        return view(*args, **kwargs)
+    return guarded
+
+
+def view_routes(app):
+    """Code object of every view function -> its URL rule(s)"""
+    rules = {}
+    for rule in app.url_map.iter_rules():
+        rules.setdefault(rule.endpoint, []).append(rule.rule)
+    return {
+        inspect.unwrap(view).__code__: ' | '.join(rules.get(endpoint, [endpoint]))
+        for endpoint, view in app.view_functions.items()
+    }
+
+
+def init_profiler(app):
+    """Register /debug/profile. Does nothing when no PROFILER_TOKEN is configured."""
+    if not app.config.get('PROFILER_TOKEN'):
+        return
+
+    max_seconds = float(app.config.get('PROFILER_MAX_SECONDS', 60))
+    one_at_a_time = threading.Lock()
+
+    @app.route('/debug/profile', methods=['GET'])
+    @admin_required
+    def debug_profile():
+        try:
+            seconds = float(request.args.get('seconds', 10))
+            hz = float(request.args.get('hz', DEFAULT_HZ))
+        except ValueError:
+            return jsonify({'error': 'seconds and hz must be numbers'}), 400
+        if not 0 < seconds <= max_seconds or not 0 < hz <= MAX_HZ:
+            return jsonify({'error': f'seconds must be in (0, {max_seconds:g}], hz in (0, {MAX_HZ}]'}), 400
+
+        if not one_at_a_time.acquire(blocking=False):
+            return jsonify({'error': 'A profile is already running'}), 409
+        try:
+            sampler = StackSampler(view_routes(app)).run(seconds, hz)
+        finally:
+            one_at_a_time.release()
+
+        response = Response(sampler.collapsed(), mimetype='text/plain')
+        response.headers['X-Profile-Ticks'] = str(sampler.ticks)
+        response.headers['X-Profile-Samples'] = str(sum(sampler.stacks.values()))
+        return response
@@ -0,0 +1,100 @@
+"""
+Primary / read-replica routing.
+
+- GET / HEAD requests read from the 'replica' bind
+- everything else (and any flush) goes to the primary
+- after a successful write the client gets a short-lived cookie; while it
+  is valid its GETs stay on the primary, so users always see their own
+  writes even if the replica is lagging (read-your-writes)
+
+Config:
+    DATABASE_REPLICA_URL     replica URI, routing is off when it is not set
+    REPLICA_STICKY_SECONDS   read-your-writes window (default 5)
+    SIMULATE_REPLICA_LAG     seconds; copies the primary SQLite file onto the
+                             replica SQLite file that often (local testing only)
+"""
+
+import sqlite3
+import threading
+import time
+
+from flask import g, has_request_context, request
+from flask_sqlalchemy.session import Session
+
+REPLICA_BIND = 'replica'
+STICKY_COOKIE = 'rw_primary_until'
+READ_METHODS = ('GET', 'HEAD')
+
+
+class RoutingSession(Session):
+    """Session that sends reads to the replica when the current request allows it"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and not self._flushing
+            and has_request_context()
+            and g.get('use_replica', False)
+        ):
+            return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def init_replica_routing(app):
+    """Register the request hooks. Does nothing when no replica is configured."""
+    if REPLICA_BIND not in app.config.get('SQLALCHEMY_BINDS', {}):
+        return
+
+    sticky_seconds = float(app.config.get('REPLICA_STICKY_SECONDS', 5))
+
+    @app.before_request
+    def choose_database():
+        try:
+            primary_until = float(request.cookies.get(STICKY_COOKIE, 0))
+        except ValueError:
+            primary_until = 0
+        g.use_replica = request.method in READ_METHODS and time.time() >= primary_until
+
+    @app.after_request
+    def stick_to_primary(response):
+        if request.method not in READ_METHODS and response.status_code < 400:
+            until = time.time() + sticky_seconds
+            response.set_cookie(STICKY_COOKIE, f"{until:.3f}", max_age=int(sticky_seconds) + 1, httponly=True)
+        return response
+
+
+class SimulatedReplication:
+    """
+    Local stand-in for MySQL replication between two SQLite files:
+    every `lag` seconds the primary file is copied over the replica file.
+    """
+
+    def __init__(self, primary_path, replica_path, lag):
+        self.primary_path = primary_path
+        self.replica_path = replica_path
+        self.lag = lag
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='sqlite-replication', daemon=True)
+
+    def sync(self):
+        """Copy the primary onto the replica right now"""
+        src = sqlite3.connect(self.primary_path)
+        dst = sqlite3.connect(self.replica_path)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
+
+    def _run(self):
+        while not self._stop.wait(self.lag):
+            self.sync()
+
+    def start(self):
+        self.sync()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
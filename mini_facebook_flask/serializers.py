@@ -0,0 +1,80 @@
+"""
+Fast read path for list endpoints.
+
+- `?fields=id,name` picks which columns are loaded (all columns by default)
+- rows are fetched as plain tuples with `with_entities`, so no ORM objects
+  and no identity-map bookkeeping are created for read-only lists
+- if `orjson` is installed, Flask's JSON encoding is switched to it
+"""
+
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import DateTime
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, stdlib json is used otherwise
+    orjson = None
+
+
+class FieldsError(ValueError):
+    """Bad ?fields= parameter (answered with a 400)"""
+
+
+def parse_fields(model, raw):
+    """'id,name' -> ['id', 'name'], every column when raw is empty"""
+    columns = model.__table__.columns.keys()
+    if not raw:
+        return list(columns)
+
+    names = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in names if name not in columns]
+    if unknown:
+        raise FieldsError(f"Unknown field(s): {', '.join(unknown)}")
+    return names
+
+
+def project(query, model, names):
+    """Same query, but only selecting the given columns"""
+    return query.with_entities(*[getattr(model, name) for name in names])
+
+
+def rows_to_dicts(rows, model, names):
+    """
+    Tuple rows -> list of dicts, same shape as model.to_dict()
+    Time: O(rows * fields)
+    """
+    date_positions = [
+        i for i, name in enumerate(names)
+        if isinstance(model.__table__.columns[name].type, DateTime)
+    ]
+
+    if not date_positions:
+        return [dict(zip(names, row)) for row in rows]
+
+    result = []
+    for row in rows:
+        values = list(row)
+        for i in date_positions:
+            if values[i] is not None:
+                values[i] = values[i].isoformat()
+        result.append(dict(zip(names, values)))
+    return result
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (keeps sorted keys like the default one)"""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def install_json_provider(app):
+    """Use orjson for jsonify() when it is available"""
+    if orjson is not None:
+        app.json = FastJSONProvider(app)
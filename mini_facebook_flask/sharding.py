@@ -0,0 +1,150 @@
+"""
+Optional horizontal sharding of posts, comments and likes.
+
+Shard map:
+- a post lives on shard  user_id % N   (all posts of one author together)
+- comments and likes live with their post, on shard  post_id % N
+
+To make that work every sharded row id carries its shard: ids are
+`ticket * N + shard_index`, where `ticket` comes from a per-shard
+auto-increment table. So `id % N` always tells where a post / comment /
+like is, and `GET /posts/<id>` or `/comments/<id>` touch a single shard.
+
+Queries that can't be pinned to one shard (e.g. all posts) run on every
+shard (scatter) and the results are combined (gather); see merge_ordered.
+
+Built on SQLAlchemy's horizontal_shard extension. Tables are created on
+every shard; on MySQL the shard databases must also have the `users`
+table (or FK checks disabled) because posts/comments/likes reference it.
+
+Limitations: with sharding on, posts/comments/likes (SHARDED_TABLES) exist
+on the shards only, not in the main DB. Relationships that cross the two
+(User.posts / .comments / .likes, Post.user, Comment.user, Like.user) must
+not be used. DELETE /users/<id> removes the user's rows from the shards
+first and then the user from the main DB; the two commits are not atomic.
+"""
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, event, inspect, insert
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.sql import operators, visitors
+
+# one row per allocated id, only the auto-increment value is used
+tickets_metadata = MetaData()
+id_tickets = Table('shard_id_tickets', tickets_metadata, Column('id', Integer, primary_key=True))
+
+# created on the shards only, never in the main DB
+SHARDED_TABLES = ('posts', 'comments', 'likes')
+
+
+class ShardMap:
+    """Maps author / post ids to shard names and owns the sharded session"""
+
+    def __init__(self, urls, post_model, comment_model, like_model):
+        self.names = [f'shard{i}' for i in range(len(urls))]
+        self.engines = {name: create_engine(url) for name, url in zip(self.names, urls)}
+        self.post_model = post_model
+        self.models = (post_model, comment_model, like_model)
+        self.tables = [model.__table__ for model in self.models]
+
+        posts, comments, likes = (table.name for table in self.tables)
+        self.routing_columns = {  # (table, column) -> shard lookup
+            (posts, 'user_id'): self.for_user,
+            (posts, 'id'): self.for_id,
+            (comments, 'post_id'): self.for_id,
+            (comments, 'id'): self.for_id,
+            (likes, 'post_id'): self.for_id,
+            (likes, 'id'): self.for_id,
+        }
+
+        factory = sessionmaker(
+            class_=ShardedSession,
+            shards=self.engines,
+            shard_chooser=self.shard_chooser,
+            identity_chooser=self.identity_chooser,
+            execute_chooser=self.execute_chooser,
+        )
+        self.session = scoped_session(factory)
+        event.listen(factory, 'before_flush', self.assign_ids)
+
+    def __len__(self):
+        return len(self.names)
+
+    # ---------- shard map ----------
+
+    def for_user(self, user_id):
+        return self.names[int(user_id) % len(self.names)]
+
+    def for_id(self, row_id):
+        """Shard of a post / comment / like id (also of a comment's or like's post_id)"""
+        return self.names[int(row_id) % len(self.names)]
+
+    def _shard_for_new(self, instance):
+        if isinstance(instance, self.post_model):
+            return self.for_user(instance.user_id)
+        return self.for_id(instance.post_id)
+
+    def create_all(self):
+        for engine in self.engines.values():
+            self.tables[0].metadata.create_all(engine, tables=self.tables)
+            tickets_metadata.create_all(engine)
+
+    # ---------- ShardedSession hooks ----------
+
+    def assign_ids(self, session, flush_context, instances):
+        """Give every new sharded row an id that encodes its shard"""
+        for obj in session.new:
+            if not isinstance(obj, self.models) or obj.id is not None:
+                continue
+            shard = self._shard_for_new(obj)
+            conn = session.connection(bind_arguments={'shard_id': shard})
+            ticket = conn.execute(insert(id_tickets)).inserted_primary_key[0]
+            obj.id = ticket * len(self.names) + self.names.index(shard)
+            inspect(obj).identity_token = shard
+
+    def shard_chooser(self, mapper, instance, clause=None):
+        if instance is not None:
+            if getattr(instance, 'id', None) is not None:
+                return self.for_id(instance.id)
+            return self._shard_for_new(instance)
+        raise ValueError(f"Can't pick a shard for {mapper} without an instance")
+
+    def identity_chooser(self, mapper, primary_key, *, lazy_loaded_from, **kwargs):
+        if lazy_loaded_from is not None and lazy_loaded_from.identity_token:
+            return [lazy_loaded_from.identity_token]
+        return [self.for_id(primary_key[0])]
+
+    def execute_chooser(self, orm_context):
+        """Single shard when the WHERE clause pins a routing column, else all shards"""
+        if orm_context.lazy_loaded_from is not None and orm_context.lazy_loaded_from.identity_token:
+            return [orm_context.lazy_loaded_from.identity_token]
+
+        shards = set()
+        for column, value in _equality_comparisons(orm_context.statement):
+            router = self.routing_columns.get((column.table.name, column.name))
+            if router is not None:
+                shards.add(router(value))
+        return sorted(shards) if shards else self.names
+
+
+def _equality_comparisons(statement):
+    """Yield (column, value) for every `column == literal` in the statement's WHERE"""
+    binary_expressions = []
+    visitors.traverse(statement, {}, {'binary': binary_expressions.append})
+
+    for binary in binary_expressions:
+        if binary.operator is not operators.eq:
+            continue
+        left, right = binary.left, binary.right
+        if hasattr(right, 'table') and not hasattr(left, 'table'):
+            left, right = right, left
+        if hasattr(left, 'table') and hasattr(right, 'effective_value') and right.effective_value is not None:
+            yield left, right.effective_value
+
+
+def merge_ordered(rows, key):
+    """
+    Gather step: each shard returned its rows already sorted, one run after
+    another. Timsort detects those runs, so this is an O(n log shards) merge.
+    """
+    return sorted(rows, key=key)
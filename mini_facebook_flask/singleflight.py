@@ -0,0 +1,107 @@
+"""
+Single-flight request coalescing for hot reads.
+
+If 300 requests ask for the like count of the same viral post at the same
+moment, only the first one (the "leader") runs the query; the others wait
+for it and share its result. With `ttl` > 0 the result is also kept for
+that many seconds (micro cache) so back-to-back requests skip the DB too.
+
+Only plain data (dicts, lists, numbers) should be returned from the
+wrapped functions: ORM objects belong to the leader's session.
+"""
+
+import threading
+import time
+
+
+class _Call:
+    """One in-flight load, shared by the leader and its waiters"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.cacheable = True  # cleared by forget() if a write lands meanwhile
+
+
+class SingleFlight:
+    def __init__(self, ttl=0.0, max_cached=10_000):
+        self.ttl = ttl
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._calls = {}   # key -> _Call in progress
+        self._cache = {}   # key -> (expires_at, result), only when ttl > 0
+        self.requests = 0
+        self.executed = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    def do(self, key, fn):
+        """Return fn()'s result, running it at most once for concurrent callers of key"""
+        with self._lock:
+            self.requests += 1
+            if self.ttl:
+                cached = self._cache.get(key)
+                if cached and cached[0] > time.monotonic():
+                    self.cache_hits += 1
+                    return cached[1]
+
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:  # forget() may have detached it already
+                    del self._calls[key]
+                if self.ttl and call.error is None and call.cacheable:
+                    self._remember(key, call.result)
+            call.done.set()
+        return call.result
+
+    def _remember(self, key, result):
+        now = time.monotonic()
+        if len(self._cache) >= self.max_cached:
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+        self._cache[key] = (now + self.ttl, result)
+
+    def forget(self, *prefix):
+        """
+        Drop cached results whose key starts with prefix (call after a write).
+        In-flight loads for those keys are detached: they may have read
+        before the write, so later callers start a fresh load instead of
+        joining them, and their result is not cached.
+        """
+        n = len(prefix)
+        with self._lock:
+            for key in [k for k in self._cache if k[:n] == prefix]:
+                del self._cache[key]
+            for key in [k for k in self._calls if k[:n] == prefix]:
+                self._calls.pop(key).cacheable = False
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'cache_hits': self.cache_hits,
+                'in_flight': len(self._calls),
+                'ttl': self.ttl,
+            }
@@ -0,0 +1,220 @@
+"""
+Incremental trending-posts ranking.
+
+Every like / comment adds a weight to the post's score, and that weight
+halves every `half_life` seconds. Instead of decaying all scores on every
+tick, each event is stored already "grown" relative to a fixed reference
+time (t0):
+
+    stored = weight * 2 ** ((event_time - t0) / half_life)
+
+All stored scores shrink by the same factor as time passes, so their order
+never changes and the top-K heap stays valid without touching it. The
+real (decayed) score is stored * 2 ** ((t0 - now) / half_life).
+
+Compaction drops posts whose decayed score fell under `min_score` and
+moves t0 forward so the stored numbers never overflow.
+"""
+
+import heapq
+import math
+import threading
+import time
+from datetime import timezone
+
+
+class TrendingEngine:
+    """Time-decayed score per post plus a bounded top-K heap"""
+
+    def __init__(self, top_k=50, half_life=6 * 3600, like_weight=1.0, comment_weight=2.0,
+                 min_score=0.01, compact_every=600):
+        self.top_k = top_k
+        self.half_life = half_life
+        self.like_weight = like_weight
+        self.comment_weight = comment_weight
+        self.min_score = min_score
+        self.compact_every = compact_every
+
+        self._lock = threading.Lock()
+        self._t0 = time.time()
+        self._last_compact = self._t0
+        self._scores = {}     # post_id -> stored (t0-relative) score
+        self._heap = []       # min-heap of (stored score, post_id), at most top_k items
+        self._in_heap = set()
+        self._dirty = False   # a heap member went down -> heap must be rebuilt
+        self._rebuild_logs = []  # events seen while a rebuild() is scanning, one list per rebuild
+        self.loaded = False   # set once rebuild() has run (cold start done)
+
+    # ---------- helpers ----------
+
+    def _grow(self, ts):
+        """Factor that moves a weight from time ts to the t0 reference"""
+        return 2.0 ** ((ts - self._t0) / self.half_life)
+
+    def _push(self, post_id, stored):
+        """Keep the heap bounded to top_k after post_id's score went up"""
+        if post_id in self._in_heap:
+            # K is small, so rebuilding the heap is cheaper than searching it
+            self._heap = [(self._scores[p], p) for p in self._in_heap]
+            heapq.heapify(self._heap)
+        elif len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, (stored, post_id))
+            self._in_heap.add(post_id)
+        elif stored > self._heap[0][0]:
+            _, dropped = heapq.heapreplace(self._heap, (stored, post_id))
+            self._in_heap.discard(dropped)
+            self._in_heap.add(post_id)
+
+    def _rebuild_heap(self):
+        """O(n log K) pass over all scores, only needed after a decrement"""
+        best = heapq.nlargest(self.top_k, self._scores.items(), key=lambda item: item[1])
+        self._heap = [(score, post_id) for post_id, score in best]
+        heapq.heapify(self._heap)
+        self._in_heap = {post_id for post_id, _ in best}
+        self._dirty = False
+
+    def _add(self, post_id, weight, ts):
+        stored = self._scores.get(post_id, 0.0) + weight * self._grow(ts)
+        if stored <= 0:
+            self._scores.pop(post_id, None)
+        else:
+            self._scores[post_id] = stored
+
+        if weight < 0:
+            if post_id in self._in_heap:
+                self._dirty = True
+        elif not self._dirty:
+            self._push(post_id, stored)
+
+    # ---------- events ----------
+
+    def record_like(self, post_id, ts=None):
+        self._event(post_id, self.like_weight, ts)
+
+    def record_unlike(self, post_id, ts=None):
+        """ts = when the like was made, so exactly its decayed weight is taken back"""
+        self._event(post_id, -self.like_weight, ts)
+
+    def record_comment(self, post_id, ts=None):
+        self._event(post_id, self.comment_weight, ts)
+
+    def _event(self, post_id, weight, ts):
+        now = time.time()
+        ts = now if ts is None else ts
+        with self._lock:
+            for log in self._rebuild_logs:
+                log.append((post_id, weight, ts))
+            self._add(post_id, weight, ts)
+            if now - self._last_compact >= self.compact_every:
+                self._compact(now)
+
+    def remove_post(self, post_id):
+        """Forget a post (e.g. it was deleted)"""
+        with self._lock:
+            for log in self._rebuild_logs:
+                log.append((post_id, None, None))
+            self._scores.pop(post_id, None)
+            if post_id in self._in_heap:
+                self._dirty = True
+
+    # ---------- reads ----------
+
+    def top(self, limit=None, now=None):
+        """Return [(post_id, decayed score)] best first"""
+        now = time.time() if now is None else now
+        limit = self.top_k if limit is None else min(limit, self.top_k)
+        with self._lock:
+            if self._dirty:
+                self._rebuild_heap()
+            best = heapq.nlargest(limit, self._heap)
+            decay = 2.0 ** ((self._t0 - now) / self.half_life)
+        return [(post_id, stored * decay) for stored, post_id in best]
+
+    def score(self, post_id, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._scores.get(post_id, 0.0) * 2.0 ** ((self._t0 - now) / self.half_life)
+
+    def __len__(self):
+        return len(self._scores)
+
+    # ---------- maintenance ----------
+
+    def compact(self, now=None):
+        with self._lock:
+            self._compact(time.time() if now is None else now)
+
+    def _compact(self, now):
+        """Drop stale posts and rebase t0 to now"""
+        shift = 2.0 ** ((self._t0 - now) / self.half_life)
+        self._scores = {
+            post_id: stored * shift
+            for post_id, stored in self._scores.items()
+            if stored * shift >= self.min_score
+        }
+        self._t0 = now
+        self._last_compact = now
+        self._rebuild_heap()
+
+    def rebuild(self, likes, comments, now=None):
+        """
+        Cold start: recompute every score from scratch.
+        likes / comments are iterables of (post_id, event timestamp in seconds)
+        Events recorded while the rows are scanned are replayed onto the new
+        scores. Pass lazy iterables (a DB cursor), so the scan starts after
+        recording does and those events are not in the rows yet.
+        """
+        now = time.time() if now is None else now
+        log = []
+        with self._lock:
+            self._rebuild_logs.append(log)
+        try:
+            # score outside the lock so the (possibly slow) DB cursor doesn't block events
+            scores = {}
+            for rows, weight in ((likes, self.like_weight), (comments, self.comment_weight)):
+                for post_id, ts in rows:
+                    ts = now if ts is None else ts
+                    scores[post_id] = scores.get(post_id, 0.0) + weight * 2.0 ** ((ts - now) / self.half_life)
+        except BaseException:
+            with self._lock:
+                self._rebuild_logs.remove(log)
+            raise
+
+        with self._lock:
+            self._rebuild_logs.remove(log)
+            self._t0 = now
+            self._last_compact = now
+            self._scores = {p: s for p, s in scores.items() if s >= self.min_score}
+            self._dirty = True  # the heap is rebuilt once, after the replay
+            for post_id, weight, ts in log:
+                if weight is None:
+                    self._scores.pop(post_id, None)
+                else:
+                    self._add(post_id, weight, ts)
+            self._rebuild_heap()
+            self.loaded = True
+
+
+def to_timestamp(value):
+    """
+    DateTime column value -> epoch seconds (None stays None)
+    Naive values are UTC (SQLite CURRENT_TIMESTAMP, MySQL NOW() in a UTC
+    session), not server-local time, so they line up with time.time()
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+if __name__ == "__main__":
+    engine = TrendingEngine(top_k=3, half_life=60)
+    start = time.time()
+    for post_id in range(1, 6):
+        for _ in range(post_id):
+            engine.record_like(post_id, ts=start)
+    engine.record_comment(1, ts=start + 120)  # recent comment beats old likes
+    engine.record_unlike(5, ts=start)
+    print(engine.top(now=start + 120))
+    print("math check:", math.isclose(engine.score(1, now=start + 120), 2.0 + 0.25))